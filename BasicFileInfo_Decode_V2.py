@@ -1,28 +1,11 @@
 import re
-import sys
-import locale
 from pathlib import Path
 
+from rfa_output import safe_print, setup_console
+
 # Base directory where the extracted streams live
 BASE_DIR = Path("racbasicsamplefamily")
 
-STDOUT_ENCODING = sys.stdout.encoding or locale.getpreferredencoding(False)
-
-
-def safe_print(text: str = ""):
-    """Print text without UnicodeEncodeError in the Windows console."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING,
-            errors="replace"
-        ).decode(
-            STDOUT_ENCODING,
-            errors="replace"
-        )
-        print(safe)
-
 
 def load_basic_file_info() -> bytes:
     """Read racbasicsamplefamily/BasicFileInfo.bin."""
@@ -131,6 +114,7 @@ def parse_basic_file_info_text(s: str) -> dict:
 
 
 def main():
+    setup_console()
     data = load_basic_file_info()
     raw_text = decode_utf16_to_asciiish(data)
     info = parse_basic_file_info_text(raw_text)
@@ -1,42 +1,9 @@
 import argparse
 import pathlib
 import re
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or 'utf-8'
-
-
-def safe_print(text: str = ""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(STDOUT_ENCODING, errors="backslashreplace").decode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        )
-        print(safe)
-
-
-def extract_utf16le_strings(blob: bytes, min_len: int = 4):
-    results = []
-    current = []
-
-    def flush():
-        if len(current) >= min_len:
-            results.append("".join(current))
-        current.clear()
-
-    i = 0
-    while i + 1 < len(blob):
-        ch = blob[i]
-        nul = blob[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            flush()
-        i += 2
-
-    flush()
-    return results
+from rfa_output import safe_print, setup_console
+from rfa_strings import utf16le_strings
 
 
 def decode_length_prefixed_utf16le(blob: bytes, max_len: int = 4096):
@@ -93,6 +60,7 @@ def main():
         help="Path to BasicFileInfo.bin",
     )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -134,7 +102,7 @@ def main():
         safe_print()
 
     safe_print("Extracted UTF-16LE substrings (scan):")
-    for s in extract_utf16le_strings(blob):
+    for s in utf16le_strings(blob):
         safe_print(f"  {s}")
 
     return 0
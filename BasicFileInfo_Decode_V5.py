@@ -1,47 +1,12 @@
 import argparse
 import json
-import locale
 import pathlib
 import re
-import sys
-
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
-BASE_DEFAULT = pathlib.Path("racbasicsamplefamily") / "BasicFileInfo.bin"
-
-
-def safe_print(text: str = ""):
-    """Print text without the console breaking on odd Unicode."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        ).decode(STDOUT_ENCODING, errors="backslashreplace")
-        print(safe)
 
+from rfa_output import safe_print, setup_console
+from rfa_strings import utf16le_strings
 
-def extract_utf16le_strings(blob: bytes, min_len: int = 4):
-    """Scan blob as UTF-16 LE and collect readable substrings."""
-    results = []
-    current = []
-
-    def flush():
-        if len(current) >= min_len:
-            results.append("".join(current))
-        current.clear()
-
-    i = 0
-    while i + 1 < len(blob):
-        ch = blob[i]
-        nul = blob[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            flush()
-        i += 2
-
-    flush()
-    return results
+BASE_DEFAULT = pathlib.Path("racbasicsamplefamily") / "BasicFileInfo.bin"
 
 
 def decode_full_utf16le(blob: bytes):
@@ -146,6 +111,7 @@ def main():
         help="Write metadata to BasicFileInfo.json next to the bin",
     )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -187,7 +153,7 @@ def main():
     if args.dump_substrings:
         safe_print("Extracted UTF-16LE substrings (scan):")
         safe_print("-------------------------------------")
-        for s in extract_utf16le_strings(blob):
+        for s in utf16le_strings(blob):
             safe_print(f"  {s}")
         safe_print()
 
@@ -2,16 +2,8 @@ import argparse
 import json
 import pathlib
 import re
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
-
-
-def safe_print(text=""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        print(text.encode(STDOUT_ENCODING, "backslashreplace").decode(STDOUT_ENCODING))
+from rfa_output import safe_print, setup_console
 
 
 def asciiish_from_utf16(blob: bytes, endian: str) -> str:
@@ -52,6 +44,30 @@ def parse_kv_lines(lines):
     return meta, leftovers
 
 
+def decode_basic_file_info(blob: bytes):
+    """
+    Decode a BasicFileInfo stream in memory.
+    Returns (meta, leftovers, clean_be, clean_le).
+    """
+    # --- decode both ---
+    clean_le = asciiish_from_utf16(blob, "le")
+    clean_be = asciiish_from_utf16(blob, "be")
+
+    # --- split to lines ---
+    be_lines = [ln for ln in clean_be.split("\n") if ln.strip()]
+
+    # --- parse BE key/values ---
+    meta, leftovers = parse_kv_lines(be_lines)
+
+    # Add fallback format from LE
+    if "format" not in meta:
+        m = re.search(r"\b(\d{4})\b", clean_le)
+        if m:
+            meta["format"] = m.group(1)
+
+    return meta, leftovers, clean_be, clean_le
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Decode and show EVERYTHING from BasicFileInfo.bin"
@@ -68,6 +84,7 @@ def main():
         help="Write parsed metadata JSON next to bin",
     )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     blob = path.read_bytes()
@@ -75,22 +92,7 @@ def main():
     safe_print(f"File: {path}")
     safe_print(f"Size: {len(blob)} bytes\n")
 
-    # --- decode both ---
-    clean_le = asciiish_from_utf16(blob, "le")
-    clean_be = asciiish_from_utf16(blob, "be")
-
-    # --- split to lines ---
-    be_lines = [ln for ln in clean_be.split("\n") if ln.strip()]
-    le_lines = [ln for ln in clean_le.split("\n") if ln.strip()]
-
-    # --- parse BE key/values ---
-    meta, leftovers = parse_kv_lines(be_lines)
-
-    # Add fallback format from LE
-    if "format" not in meta:
-        m = re.search(r"\b(\d{4})\b", clean_le)
-        if m:
-            meta["format"] = m.group(1)
+    meta, leftovers, clean_be, clean_le = decode_basic_file_info(blob)
 
     # -------------------------
     # PRINT EVERYTHING CLEANLY
@@ -1,46 +1,24 @@
 import argparse
-import gzip
 import pathlib
 import re
-import struct
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+from rfa_gzip import find_and_decompress_gzip
+from rfa_hexdump import iter_hexdump, parse_range
+from rfa_ints import u32_view, with_offsets
+from rfa_output import safe_print, setup_console
+from rfa_strings import ascii_strings
 
 
-def safe_print(text: str = ""):
-    """Print without the console crashing on odd Unicode."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        ).decode(STDOUT_ENCODING, errors="backslashreplace")
-        print(safe)
-
-
-def hex_dump(b: bytes, width: int = 16, limit: int | None = None) -> str:
-    """Simple hexdump helper."""
-    if limit is not None:
-        b = b[:limit]
-    lines = []
-    for i in range(0, len(b), width):
-        chunk = b[i : i + width]
-        hexs = " ".join(f"{x:02X}" for x in chunk)
-        ascii_s = "".join(chr(x) if 32 <= x < 127 else "." for x in chunk)
-        lines.append(f"{i:04X}  {hexs:<{width*3}}  {ascii_s}")
-    return "\n".join(lines)
+def hex_dump(data, width: int = 16, start: int = 0, limit: int | None = None):
+    """Lazy hexdump lines of data[start:start + limit]."""
+    return iter_hexdump(
+        data, start, limit, width=width, offset_format="{:04X}  ", pad=width * 3
+    )
 
 
 def parse_header_uint32_le(blob: bytes, max_count: int = 16):
     """Interpret the first bytes as 32-bit little endian integers."""
-    count = min(max_count, len(blob) // 4)
-    entries = []
-    for i in range(count):
-        off = i * 4
-        val = struct.unpack_from("<I", blob, off)[0]
-        entries.append((off, val))
-    return entries
+    return with_offsets(u32_view(blob, count=max_count), 4)
 
 
 def asciiish_from_utf16le(blob: bytes) -> str:
@@ -63,50 +41,6 @@ def asciiish_from_utf16le(blob: bytes) -> str:
     return s.strip()
 
 
-def ascii_strings_from_bytes(blob: bytes, min_len: int = 4):
-    """Search for normal ASCII strings in raw bytes."""
-    results = []
-    current = bytearray()
-
-    def flush():
-        nonlocal current
-        if len(current) >= min_len:
-            results.append(current.decode("ascii", errors="ignore"))
-        current = bytearray()
-
-    for b in blob:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            flush()
-    flush()
-    return results
-
-
-def find_and_decompress_gzip(blob: bytes):
-    """
-    Search for a gzip header (1F 8B 08) and try to decompress it.
-    Returns (start_offset, end_offset, decompressed_bytes)
-    or (None, None, None) if nothing is found.
-    """
-    magic = b"\x1f\x8b\x08"
-
-    for i in range(len(blob) - 2):
-        if blob[i : i + 3] != magic:
-            continue
-
-        # move the end backward until gzip.decompress succeeds
-        for end in range(len(blob), i + 10, -1):
-            chunk = blob[i:end]
-            try:
-                decomp = gzip.decompress(chunk)
-                return i, end, decomp
-            except Exception:
-                continue
-
-    return None, None, None
-
-
 def main():
     parser = argparse.ArgumentParser(
         description="Decode racbasicsamplefamily/Contents.bin"
@@ -122,7 +56,15 @@ def main():
         action="store_true",
         help="Show full hexdump of Contents.bin",
     )
+    parser.add_argument(
+        "--hex-range",
+        type=parse_range,
+        default=None,
+        metavar="START:LENGTH",
+        help="Only dump this range, e.g. 0x100:256 (implies --dump-hex)",
+    )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -137,7 +79,8 @@ def main():
 
     # 1. Header analysis
     safe_print("=== Header hexdump (first 0x40 bytes) ===")
-    safe_print(hex_dump(blob[:0x40]))
+    for line in hex_dump(blob, limit=0x40):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Header as 32-bit little endian integers ===")
@@ -145,9 +88,11 @@ def main():
         safe_print(f"  offset 0x{off:04X}: {val}")
     safe_print()
 
-    if args.dump_hex:
-        safe_print("=== Full hexdump of Contents.bin ===")
-        safe_print(hex_dump(blob))
+    if args.dump_hex or args.hex_range is not None:
+        hex_start, hex_length = args.hex_range or (0, None)
+        safe_print("=== Hexdump of Contents.bin ===")
+        for line in hex_dump(blob, start=hex_start, limit=hex_length):
+            safe_print(line)
         safe_print()
 
     # 2. Find gzip segment
@@ -171,7 +116,8 @@ def main():
 
     # 4. Hexdump of decompressed data
     safe_print("=== Decompressed hex (first 0x80 bytes) ===")
-    safe_print(hex_dump(decomp, limit=0x80))
+    for line in hex_dump(decomp, limit=0x80):
+        safe_print(line)
     safe_print()
 
     # 5. UTF-16-LE interpretation
@@ -185,7 +131,7 @@ def main():
         safe_print()
 
     # 6. Extra: normal ASCII strings from decompressed bytes
-    ascii_strs = ascii_strings_from_bytes(decomp, min_len=4)
+    ascii_strs = ascii_strings(decomp, min_len=4)
     if ascii_strs:
         safe_print("=== ASCII strings from decompressed bytes ===")
         for s in ascii_strs:
@@ -1,128 +1,39 @@
 import argparse
-import gzip
 import pathlib
 import re
-import struct
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+from rfa_gzip import find_and_decompress_gzip
+from rfa_hexdump import iter_hexdump, parse_range
+from rfa_ints import u32_view, with_offsets
+from rfa_output import safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings_all_alignments
 
 
-def safe_print(text: str = ""):
-    """Print without the console crashing on odd Unicode."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        ).decode(STDOUT_ENCODING, errors="backslashreplace")
-        print(safe)
-
-
-def hex_dump(b: bytes, width: int = 16, limit: int | None = None) -> str:
-    """Simple hexdump helper."""
-    if limit is not None:
-        b = b[:limit]
-    lines = []
-    for i in range(0, len(b), width):
-        chunk = b[i : i + width]
-        hexs = " ".join(f"{x:02X}" for x in chunk)
-        ascii_s = "".join(chr(x) if 32 <= x < 127 else "." for x in chunk)
-        lines.append(f"{i:04X}  {hexs:<{width*3}}  {ascii_s}")
-    return "\n".join(lines)
+def hex_dump(data, width: int = 16, start: int = 0, limit: int | None = None):
+    """Lazy hexdump lines of data[start:start + limit]."""
+    return iter_hexdump(
+        data, start, limit, width=width, offset_format="{:04X}  ", pad=width * 3
+    )
 
 
 def parse_header_uint32_le(blob: bytes, max_count: int = 16):
     """Interpret the first bytes as 32-bit little endian integers."""
-    count = min(max_count, len(blob) // 4)
-    entries = []
-    for i in range(count):
-        off = i * 4
-        val = struct.unpack_from("<I", blob, off)[0]
-        entries.append((off, val))
-    return entries
-
-
-def ascii_strings_from_bytes(blob: bytes, min_len: int = 4):
-    """Search for normal ASCII strings in raw bytes."""
-    results = []
-    current = bytearray()
-
-    def flush():
-        nonlocal current
-        if len(current) >= min_len:
-            results.append(current.decode("ascii", errors="ignore"))
-        current = bytearray()
-
-    for b in blob:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            flush()
-    flush()
-    return results
-
-
-def extract_utf16le_strings_all_alignments(blob: bytes, min_len: int = 4):
-    """
-    Search for UTF-16LE strings while trying both possible alignments
-    (offset 0 and 1). This finds both 'David Conant'
-    and '20190207_1515(x64)'.
-    """
-    results = []
-
-    for start_offset in (0, 1):
-        current = []
-
-        def flush():
-            nonlocal current
-            if len(current) >= min_len:
-                results.append("".join(current))
-            current = []
-
-        i = start_offset
-        while i + 1 < len(blob):
-            ch = blob[i]
-            nul = blob[i + 1]
-            if 32 <= ch <= 126 and nul == 0:
-                current.append(chr(ch))
-            else:
-                flush()
-            i += 2
-        flush()
-
-    # remove duplicates
-    dedup = []
-    seen = set()
-    for s in results:
-        if s not in seen:
-            seen.add(s)
-            dedup.append(s)
-    return dedup
-
-
-def find_and_decompress_gzip(blob: bytes):
-    """
-    Search for a gzip header (1F 8B 08) in the blob and try to
-    decompress it by moving the end backward until gzip.decompress
-    succeeds. Returns (start, end, decompressed_bytes) or (None, None, None).
-    """
-    magic = b"\x1f\x8b\x08"
-
-    for i in range(len(blob) - 2):
-        if blob[i : i + 3] != magic:
-            continue
-
-        # move the end backward until gzip.decompress succeeds
-        for end in range(len(blob), i + 10, -1):
-            chunk = blob[i:end]
-            try:
-                decomp = gzip.decompress(chunk)
-                return i, end, decomp
-            except Exception:
-                continue
-
-    return None, None, None
+    return with_offsets(u32_view(blob, count=max_count), 4)
+
+
+BUILD_PATTERN = re.compile(r"\b20[0-9]{6}_[0-9]{4}\(x[0-9]+\)")
+
+
+def guess_metadata(utf16_strings):
+    """Best guess (author, build) from the UTF-16 strings of Contents."""
+    author = utf16_strings[0] if utf16_strings else None
+    build = None
+    for s in utf16_strings:
+        m = BUILD_PATTERN.search(s)
+        if m:
+            build = m.group(0)
+            break
+    return author, build
 
 
 def main():
@@ -140,7 +51,15 @@ def main():
         action="store_true",
         help="Show full hexdump of Contents.bin",
     )
+    parser.add_argument(
+        "--hex-range",
+        type=parse_range,
+        default=None,
+        metavar="START:LENGTH",
+        help="Only dump this range, e.g. 0x100:256 (implies --dump-hex)",
+    )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -155,7 +74,8 @@ def main():
 
     # 1. Header analysis
     safe_print("=== Header hexdump (first 0x40 bytes) ===")
-    safe_print(hex_dump(blob[:0x40]))
+    for line in hex_dump(blob, limit=0x40):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Header as 32-bit little endian integers ===")
@@ -163,9 +83,11 @@ def main():
         safe_print(f"  offset 0x{off:04X}: {val}")
     safe_print()
 
-    if args.dump_hex:
-        safe_print("=== Full hexdump of Contents.bin ===")
-        safe_print(hex_dump(blob))
+    if args.dump_hex or args.hex_range is not None:
+        hex_start, hex_length = args.hex_range or (0, None)
+        safe_print("=== Hexdump of Contents.bin ===")
+        for line in hex_dump(blob, start=hex_start, limit=hex_length):
+            safe_print(line)
         safe_print()
 
     # 2. Find gzip segment
@@ -189,12 +111,13 @@ def main():
 
     # 4. Hexdump of decompressed data
     safe_print("=== Decompressed hex (first 0x80 bytes) ===")
-    safe_print(hex_dump(decomp, limit=0x80))
+    for line in hex_dump(decomp, limit=0x80):
+        safe_print(line)
     safe_print()
 
     # 5. Strings from decompressed bytes
-    utf16_strings = extract_utf16le_strings_all_alignments(decomp, min_len=4)
-    ascii_strings = ascii_strings_from_bytes(decomp, min_len=4)
+    utf16_strings = utf16le_strings_all_alignments(decomp, min_len=4)
+    ascii_found = ascii_strings(decomp, min_len=4)
 
     safe_print("=== UTF-16-LE strings (all alignments) ===")
     if utf16_strings:
@@ -205,21 +128,15 @@ def main():
     safe_print()
 
     safe_print("=== ASCII strings from decompressed bytes ===")
-    if ascii_strings:
-        for s in ascii_strings:
+    if ascii_found:
+        for s in ascii_found:
             safe_print(f"  {s}")
     else:
         safe_print("  <none>")
     safe_print()
 
     # 6. Best guess: author + build from UTF-16 strings
-    author = utf16_strings[0] if utf16_strings else None
-    build = None
-    for s in utf16_strings:
-        m = re.search(r"\b20[0-9]{6}_[0-9]{4}\(x[0-9]+\)", s)
-        if m:
-            build = m.group(0)
-            break
+    author, build = guess_metadata(utf16_strings)
 
     safe_print("=== Decoded metadata from Contents ===")
     if author:
@@ -3,37 +3,16 @@ import binascii
 import pathlib
 import re
 import struct
-import sys
-import zlib
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+try:
+    import numpy as np
+except ImportError:  # plain-Python run-length table instead
+    np = None
 
-
-def safe_print(text: str = ""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(STDOUT_ENCODING, errors="backslashreplace").decode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        )
-        print(safe)
-
-
-def emit_lines(lines, output_lines):
-    for line in lines:
-        safe_print(line)
-        output_lines.append(line)
-
-
-def hexdump(data: bytes, max_bytes: int = 128, width: int = 16):
-    data = data[:max_bytes]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hex_part = " ".join(f"{b:02X}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{i:08X}: {hex_part:<47}  {ascii_part}")
-    return lines
+from rfa_gzip import inflate_bounded
+from rfa_hexdump import iter_hexdump
+from rfa_output import emit_lines, report_writer, safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings
 
 
 def parse_gzip_header(data: bytes):
@@ -64,110 +43,91 @@ def decompress_gzip_ignore_crc(data: bytes):
     if len(data) < start + 8:
         raise ValueError("Truncated gzip stream")
     payload = data[start:-8]
-    out = zlib.decompress(payload, wbits=-zlib.MAX_WBITS)
+    out, end = inflate_bounded(payload)
+    if end is None:
+        raise ValueError("Truncated deflate stream")
     return out
 
 
-def extract_ascii_strings(data: bytes, min_len: int = 4):
-    results = []
-    current = bytearray()
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                results.append(current.decode("ascii", errors="ignore"))
-            current = bytearray()
-    if len(current) >= min_len:
-        results.append(current.decode("ascii", errors="ignore"))
-    return results
-
-
-def extract_utf16le_strings(data: bytes, min_len: int = 4):
-    results = []
-    current = []
-    i = 0
-    while i + 1 < len(data):
-        ch = data[i]
-        nul = data[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            if len(current) >= min_len:
-                results.append("".join(current))
-            current = []
-        i += 2
-    if len(current) >= min_len:
-        results.append("".join(current))
-    return results
+def printable_run_lengths(data: bytes):
+    """
+    run[i] = number of consecutive printable ASCII bytes starting at i.
+    Computed once, so every candidate length check below is O(1).
+    """
+    n = len(data)
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        bad = (arr - 0x20) >= 0x5F
+        # index of the next non-printable byte at or after i (n if none)
+        next_bad = np.where(bad, np.arange(n), n)
+        next_bad = np.minimum.accumulate(next_bad[::-1])[::-1]
+        return next_bad - np.arange(n)
+    run = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        if 32 <= data[i] <= 126:
+            run[i] = run[i + 1] + 1
+    return run
 
 
 def find_length_prefixed_ascii(data: bytes, min_len: int = 3, max_len: int = 128):
+    """
+    Find u16-length-prefixed printable ASCII strings.
+    Returns unique (offset, string) pairs in offset order.
+    """
     results = []
     seen = set()
-    for i in range(0, len(data) - 2):
-        length = data[i] | (data[i + 1] << 8)
-        if length < min_len or length > max_len:
-            continue
-        end = i + 2 + length
-        if end > len(data):
-            continue
-        chunk = data[i + 2 : end]
-        if all(32 <= b <= 126 for b in chunk):
-            s = chunk.decode("ascii", errors="ignore")
-            if s not in seen:
-                results.append((i, s))
-                seen.add(s)
-    return results
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Decode Formats_Latest.bin from an RFA unpack."
-    )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        default=r"racbasicsamplefamily\Formats_Latest.bin",
-        help="Path to Formats_Latest.bin",
-    )
-    args = parser.parse_args()
-
-    path = pathlib.Path(args.path)
-    if not path.exists():
-        safe_print(f"File not found: {path}")
-        return 1
+    n = len(data)
+    if n < 3:
+        return results
+    run = printable_run_lengths(data)
+
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        offsets = np.arange(n - 2)
+        lengths = arr[:-2].astype(np.int64) | (arr[1:-1].astype(np.int64) << 8)
+        ok = (lengths >= min_len) & (lengths <= max_len)
+        ok &= offsets + 2 + lengths <= n
+        ok &= run[2:] >= lengths
+        hits = zip(np.flatnonzero(ok).tolist(), lengths[ok].tolist())
+    else:
+        hits = (
+            (i, length)
+            for i in range(n - 2)
+            for length in (data[i] | (data[i + 1] << 8),)
+            if min_len <= length <= max_len
+            and i + 2 + length <= n
+            and run[i + 2] >= length
+        )
 
-    blob = path.read_bytes()
-    output_lines = []
+    for i, length in hits:
+        s = data[i + 2 : i + 2 + length].decode("ascii")
+        if s not in seen:
+            results.append((i, s))
+            seen.add(s)
+    return results
 
-    def emit(text: str = ""):
-        safe_print(text)
-        output_lines.append(text)
 
+def write_report(path: pathlib.Path, blob: bytes, emit):
+    """Emit the full report line by line; returns an error message or None."""
     emit(f"File: {path}")
     emit(f"Size: {len(blob)} bytes")
     emit()
 
     emit("Header hexdump (first 128 bytes):")
-    emit_lines(hexdump(blob, max_bytes=128), output_lines)
+    emit_lines(iter_hexdump(blob, length=128), emit)
     emit()
 
     try:
         data = decompress_gzip_ignore_crc(blob)
     except Exception as exc:
         emit(f"Decompression failed: {exc}")
-        output_dir = pathlib.Path(__file__).resolve().parent
-        output_path = output_dir / "Formats_Latest_V1_Readable.txt"
-        output_path.write_text("\n".join(output_lines), encoding="utf-8")
-        emit(f"Saved: {output_path}")
-        return 1
+        return f"Decompression failed: {exc}"
 
     emit(f"Decompressed size: {len(data)} bytes")
     emit()
 
     emit("Decompressed hexdump (first 128 bytes):")
-    emit_lines(hexdump(data, max_bytes=128), output_lines)
+    emit_lines(iter_hexdump(data, length=128), emit)
     emit()
 
     prefixed = find_length_prefixed_ascii(data, min_len=3, max_len=128)
@@ -177,26 +137,57 @@ def main():
             emit(f"  0x{off:06X}: {s}")
         emit()
 
-    utf16_strings = extract_utf16le_strings(data, min_len=4)
+    utf16_strings = utf16le_strings(data, min_len=4)
     if utf16_strings:
         emit("UTF-16LE strings:")
         for s in utf16_strings:
             emit(f"  {s}")
         emit()
 
-    ascii_strings = extract_ascii_strings(data, min_len=4)
-    if ascii_strings:
+    ascii_found = ascii_strings(data, min_len=4)
+    if ascii_found:
         emit("ASCII strings:")
-        for s in ascii_strings:
+        for s in ascii_found:
             emit(f"  {s}")
         emit()
 
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Formats_Latest.bin from an RFA unpack."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily\Formats_Latest.bin",
+        help="Path to Formats_Latest.bin",
+    )
+    parser.add_argument(
+        "--echo",
+        action="store_true",
+        help="Also print the full report to the console",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    path = pathlib.Path(args.path)
+    if not path.exists():
+        safe_print(f"File not found: {path}")
+        return 1
+
+    blob = path.read_bytes()
     output_dir = pathlib.Path(__file__).resolve().parent
     output_path = output_dir / "Formats_Latest_V1_Readable.txt"
-    output_path.write_text("\n".join(output_lines), encoding="utf-8")
-    emit(f"Saved: {output_path}")
-
-    return 0
+    echo = safe_print if args.echo else None
+    with report_writer(output_path, echo=echo) as emit:
+        error = write_report(path, blob, emit)
+    if error and not args.echo:
+        safe_print(error)
+    safe_print(f"Saved: {output_path}")
+
+    return 1 if error else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,276 @@
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import re
+import struct
+import time
+
+from rfa_gzip import locate_gzip
+from rfa_output import safe_print, setup_console
+
+CATALOG_VERSION = 1
+DEFAULT_CACHE_DIR = pathlib.Path(__file__).resolve().parent / "formats_cache"
+
+# printable runs that can start a class or field name
+NAME_RUN = re.compile(rb"[A-Za-z_][\x20-\x7e]*")
+NAME_OK = re.compile(r"[A-Za-z_][A-Za-z0-9_:<>,* ]*\Z")
+
+
+def iter_schema_tokens(data: bytes):
+    """
+    Walk the decompressed schema and yield name tokens in offset order:
+
+      ("class", offset, name, tag)        u16 length + name + u16 tag
+      ("field", offset, name, type_code)  u32 length + name + u16 type code
+
+    offset is where the length prefix starts. A class tag with the 0x8000
+    bit set carries a class id in the low bits; the low byte of a field
+    type code looks like the base type (0x0E = class/element reference),
+    the high byte like container/pointer flags.
+    """
+    n = len(data)
+    for m in NAME_RUN.finditer(data):
+        s = m.start()
+        run_len = m.end() - s
+        if s >= 4 and data[s - 2] == 0 and data[s - 1] == 0:
+            length = struct.unpack_from("<I", data, s - 4)[0]
+            kind, start = "field", s - 4
+        elif s >= 2:
+            length = struct.unpack_from("<H", data, s - 2)[0]
+            kind, start = "class", s - 2
+        else:
+            continue
+        if length < 2 or length > run_len or s + length + 2 > n:
+            continue
+        name = data[s : s + length].decode("ascii")
+        if not NAME_OK.match(name):
+            continue
+        extra = struct.unpack_from("<H", data, s + length)[0]
+        yield kind, start, name, extra
+
+
+def _class_header(data: bytes, name_end: int):
+    """(version, field_count) from the u16 flags, u32, u32 after a class name."""
+    if name_end + 10 > len(data):
+        return None, None
+    version, count = struct.unpack_from("<II", data, name_end + 2)
+    if count > 4096:
+        return None, None
+    return version, count
+
+
+def build_catalog(data: bytes):
+    """
+    Turn the decompressed Formats/Latest schema into a class catalog:
+    {"classes": [{"name", "offset", "class_id", "version", "parent",
+    "fields": [{"name", "offset", "type_code", "class"}]}]}.
+
+    Layout as observed in the samples (not documented by Autodesk):
+      - a class name is followed by u16 flags, u32 version, u32 field count;
+      - a top-level class whose u16 after the name has bit 0x8000 set
+        carries a class id and is followed by its parent class definition,
+        whose fields come first;
+      - a field typed 0x??0E (class reference) may be directly followed by
+        the definition of that class: 00 00, u16 tag (0x8000 | id), 00 00,
+        then the class name. Those nested classes are parsed with a stack
+        driven by the field counts.
+    """
+    classes = []
+    stack = []  # [entry, remaining fields or None if unknown]
+    pending_parent = None  # (child entry, offset where its parent would start)
+    last_field = None  # (field dict, offset just past the type code)
+
+    for kind, offset, name, extra in iter_schema_tokens(data):
+        name_end = offset + 2 + len(name)
+        if kind == "class":
+            nested_tag = None
+            if last_field is not None and offset == last_field[1] + 6:
+                tag = struct.unpack_from("<H", data, offset - 4)[0]
+                if tag & 0x8000 and (last_field[0]["type_code"] & 0xFF) == 0x0E:
+                    nested_tag = tag
+
+            entry = {
+                "name": name,
+                "offset": offset,
+                "class_id": None,
+                "version": None,
+                "parent": None,
+                "fields": [],
+            }
+            if nested_tag is not None:
+                entry["class_id"] = nested_tag & 0x7FFF
+                last_field[0]["class"] = name
+                entry["version"], remaining = _class_header(data, name_end)
+                stack.append([entry, remaining])
+            elif pending_parent is not None and offset == pending_parent[1]:
+                pending_parent[0]["parent"] = name
+                entry["version"], remaining = _class_header(data, name_end)
+                stack.append([entry, remaining])
+            elif extra & 0x8000:
+                # child first, its parent definition follows right away
+                entry["class_id"] = extra & 0x7FFF
+                stack = [[entry, None]]
+            else:
+                entry["version"], remaining = _class_header(data, name_end)
+                stack = [[entry, remaining]]
+
+            pending_parent = (entry, name_end + 4) if (
+                nested_tag is None and extra & 0x8000
+            ) else None
+            last_field = None
+            classes.append(entry)
+            continue
+
+        if not stack:
+            continue
+        # finished nested / parent definitions hand back to their owner
+        while len(stack) > 1 and stack[-1][1] is not None and stack[-1][1] <= 0:
+            stack.pop()
+        owner = stack[-1]
+        field = {"name": name, "offset": offset, "type_code": extra, "class": None}
+        owner[0]["fields"].append(field)
+        if owner[1] is not None:
+            owner[1] -= 1
+        last_field = (field, offset + 4 + len(name) + 2)
+        pending_parent = None
+
+    return {"classes": classes}
+
+
+def decompress_formats_latest(blob: bytes):
+    """
+    Inflate the Formats/Latest gzip member. The trailer of this stream
+    does not match the data in the samples, so the CRC is not enforced.
+    """
+    member = locate_gzip(blob, verify=False)
+    if member is None:
+        raise ValueError("No gzip member in Formats/Latest")
+    return member["data"]
+
+
+def stream_hash(blob: bytes) -> str:
+    return hashlib.sha256(blob).hexdigest()
+
+
+def load_catalog(blob: bytes, cache_dir: pathlib.Path | None = DEFAULT_CACHE_DIR):
+    """
+    Return (catalog, cache_hit). The cache key is the hash of the raw
+    (still compressed) stream, which is identical for every file saved by
+    the same Revit build; a hit skips decompression and parsing.
+    """
+    digest = stream_hash(blob)
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = pathlib.Path(cache_dir) / f"{digest}.json"
+        try:
+            catalog = json.loads(cache_path.read_text(encoding="utf-8"))
+            if catalog.get("version") == CATALOG_VERSION:
+                return catalog, True
+        except (OSError, ValueError):
+            pass
+
+    data = decompress_formats_latest(blob)
+    catalog = build_catalog(data)
+    catalog["version"] = CATALOG_VERSION
+    catalog["stream_sha256"] = digest
+    catalog["decompressed_size"] = len(data)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # private temp name: parallel batch workers may cache the same build
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(catalog), encoding="utf-8")
+        tmp.replace(cache_path)
+    return catalog, False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Formats_Latest.bin into a class/field catalog "
+                    "(cached per Revit build)."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily/Formats_Latest.bin",
+        help="Path to Formats_Latest.bin",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Catalog cache folder (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always decompress and parse, do not read or write the cache",
+    )
+    parser.add_argument(
+        "--class",
+        dest="class_name",
+        help="Only show classes whose name contains this text",
+    )
+    parser.add_argument(
+        "--json-out",
+        action="store_true",
+        help="Write the catalog as JSON next to the bin",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    path = pathlib.Path(args.path)
+    if not path.exists():
+        safe_print(f"File not found: {path}")
+        return 1
+
+    blob = path.read_bytes()
+    start = time.perf_counter()
+    try:
+        catalog, hit = load_catalog(
+            blob, None if args.no_cache else pathlib.Path(args.cache_dir)
+        )
+    except Exception as exc:
+        safe_print(f"Decompression failed: {exc}")
+        return 1
+    elapsed = (time.perf_counter() - start) * 1000
+
+    classes = catalog["classes"]
+    safe_print(f"File: {path}")
+    safe_print(f"Size: {len(blob)} bytes")
+    safe_print(f"Stream sha256: {catalog['stream_sha256']}")
+    safe_print(f"Decompressed size: {catalog['decompressed_size']} bytes")
+    safe_print(f"Catalog: {'cache hit' if hit else 'parsed'} in {elapsed:.1f} ms")
+    safe_print(f"Classes: {len(classes)}")
+    safe_print(f"Fields:  {sum(len(c['fields']) for c in classes)}")
+    safe_print()
+
+    for cls in classes:
+        if args.class_name and args.class_name not in cls["name"]:
+            continue
+        header = f"0x{cls['offset']:06X}: {cls['name']}"
+        if cls["class_id"] is not None:
+            header += f"  [id {cls['class_id']}]"
+        if cls["version"] is not None:
+            header += f"  v{cls['version']}"
+        if cls["parent"]:
+            header += f"  : {cls['parent']}"
+        safe_print(header)
+        for field in cls["fields"]:
+            line = f"    {field['name']:<40} type 0x{field['type_code']:04X}"
+            if field["class"]:
+                line += f"  -> {field['class']}"
+            safe_print(line)
+
+    if args.json_out:
+        json_path = path.with_name(path.stem + "_catalog.json")
+        json_path.write_text(json.dumps(catalog, indent=2), encoding="utf-8")
+        safe_print()
+        safe_print(f"JSON written: {json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
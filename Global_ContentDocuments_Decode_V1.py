@@ -2,20 +2,13 @@ import argparse
 import binascii
 import pathlib
 import struct
-import sys
 import zlib
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
-
-
-def safe_print(text: str = ""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(STDOUT_ENCODING, errors="backslashreplace").decode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        )
-        print(safe)
+from rfa_gzip import inflate_bounded
+from rfa_hexdump import iter_hexdump
+from rfa_ints import u16_view, u32_view
+from rfa_output import safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings
 
 
 def emit_lines(lines, output_lines):
@@ -24,17 +17,6 @@ def emit_lines(lines, output_lines):
         output_lines.append(line)
 
 
-def hexdump(data: bytes, max_bytes: int = 256, width: int = 16):
-    data = data[:max_bytes]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hex_part = " ".join(f"{b:02X}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{i:08X}: {hex_part:<47}  {ascii_part}")
-    return lines
-
-
 def parse_gzip_header(data: bytes):
     if len(data) < 10 or data[:2] != b"\x1f\x8b":
         raise ValueError("Not a gzip stream")
@@ -90,57 +72,9 @@ def decompress_gzip_raw(data: bytes):
     trailer = data[-8:]
     crc32 = struct.unpack_from("<I", trailer, 0)[0]
     isize = struct.unpack_from("<I", trailer, 4)[0]
-    obj = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
-    out = obj.decompress(payload)
-    return out, obj.unused_data, header, crc32, isize
-
-
-def extract_ascii_strings(data: bytes, min_len: int = 3):
-    results = []
-    current = bytearray()
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                results.append(current.decode("ascii", errors="ignore"))
-            current = bytearray()
-    if len(current) >= min_len:
-        results.append(current.decode("ascii", errors="ignore"))
-    return results
-
-
-def extract_utf16le_strings(data: bytes, min_len: int = 3):
-    results = []
-    current = []
-    i = 0
-    while i + 1 < len(data):
-        ch = data[i]
-        nul = data[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            if len(current) >= min_len:
-                results.append("".join(current))
-            current = []
-        i += 2
-    if len(current) >= min_len:
-        results.append("".join(current))
-    return results
-
-
-def format_u16_list(data: bytes):
-    values = []
-    for i in range(0, len(data) - 1, 2):
-        values.append(struct.unpack_from("<H", data, i)[0])
-    return values
-
-
-def format_u32_list(data: bytes):
-    values = []
-    for i in range(0, len(data) - 3, 4):
-        values.append(struct.unpack_from("<I", data, i)[0])
-    return values
+    out, end = inflate_bounded(payload)
+    unused = payload[end:] if end is not None else b""
+    return out, unused, header, crc32, isize
 
 
 def main():
@@ -154,6 +88,7 @@ def main():
         help="Path to Global_ContentDocuments.bin",
     )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -172,7 +107,7 @@ def main():
     emit()
 
     emit("File hexdump (first 256 bytes):")
-    emit_lines(hexdump(blob, max_bytes=256), output_lines)
+    emit_lines(iter_hexdump(blob, length=256), output_lines)
     emit()
 
     if len(blob) >= 8:
@@ -217,42 +152,42 @@ def main():
         emit()
 
         emit("Decompressed hexdump (all bytes):")
-        emit_lines(hexdump(data, max_bytes=len(data)), output_lines)
+        emit_lines(iter_hexdump(data), output_lines)
         emit()
 
         emit("Decompressed bytes (u8):")
         emit("  " + " ".join(f"{b:02X}" for b in data))
         emit()
 
-        u16_values = format_u16_list(data)
+        u16_values = u16_view(data)
         if u16_values:
             emit("Decompressed u16 (little-endian):")
             emit("  " + " ".join(str(v) for v in u16_values))
             emit()
 
-        u32_values = format_u32_list(data)
+        u32_values = u32_view(data)
         if u32_values:
             emit("Decompressed u32 (little-endian):")
             emit("  " + " ".join(str(v) for v in u32_values))
             emit()
 
-        utf16_strings = extract_utf16le_strings(data, min_len=3)
+        utf16_strings = utf16le_strings(data, min_len=3)
         if utf16_strings:
             emit("UTF-16LE strings:")
             for s in utf16_strings:
                 emit(f"  {s}")
             emit()
 
-        ascii_strings = extract_ascii_strings(data, min_len=3)
-        if ascii_strings:
+        ascii_found = ascii_strings(data, min_len=3)
+        if ascii_found:
             emit("ASCII strings:")
-            for s in ascii_strings:
+            for s in ascii_found:
                 emit(f"  {s}")
             emit()
 
         if unused:
             emit("Unused data after deflate stream (hex):")
-            emit_lines(hexdump(unused, max_bytes=len(unused)), output_lines)
+            emit_lines(iter_hexdump(unused), output_lines)
             emit()
     else:
         emit("No gzip signature found.")
@@ -1,34 +1,17 @@
 import argparse
-import gzip
 import pathlib
-import struct
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+from rfa_gzip import find_and_decompress_gzip
+from rfa_hexdump import iter_hexdump, parse_range
+from rfa_ints import uint_view, with_offsets
+from rfa_output import safe_print, setup_console
 
 
-def safe_print(text: str = ""):
-    """Print without the console crashing on odd Unicode."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        alt = text.encode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        ).decode(STDOUT_ENCODING, errors="backslashreplace")
-        print(alt)
-
-
-def hex_dump(data: bytes, width: int = 16, limit: int | None = None) -> str:
-    """Simple hexdump helper."""
-    if limit is not None:
-        data = data[:limit]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hexs = " ".join(f"{b:02X}" for b in chunk)
-        ascii_s = "".join(chr(b) if 32 <= b <= 126 else "." for b in chunk)
-        lines.append(f"{i:04X}  {hexs:<{width*3}}  {ascii_s}")
-    return "\n".join(lines)
+def hex_dump(data, width: int = 16, start: int = 0, limit: int | None = None):
+    """Lazy hexdump lines of data[start:start + limit]."""
+    return iter_hexdump(
+        data, start, limit, width=width, offset_format="{:04X}  ", pad=width * 3
+    )
 
 
 def parse_uints_le(blob: bytes, unit: int, max_count: int):
@@ -36,40 +19,7 @@ def parse_uints_le(blob: bytes, unit: int, max_count: int):
     Interpret the first bytes as little endian integers:
     unit = 2 (uint16) or 4 (uint32)
     """
-    count = min(max_count, len(blob) // unit)
-    vals = []
-    fmt = "<H" if unit == 2 else "<I"
-    for i in range(count):
-        off = i * unit
-        val = struct.unpack_from(fmt, blob, off)[0]
-        vals.append((off, val))
-    return vals
-
-
-def find_and_decompress_gzip(blob: bytes):
-    """
-    Search for a gzip header (1F 8B 08) in the file and try
-    to decompress a valid gzip block from that offset.
-
-    Returns (start_offset, end_offset, decompressed_bytes)
-    or (None, None, None) if nothing is found.
-    """
-    magic = b"\x1f\x8b\x08"
-
-    for start in range(len(blob) - 2):
-        if blob[start : start + 3] != magic:
-            continue
-
-        # move the end backward until gzip.decompress succeeds
-        for end in range(len(blob), start + 10, -1):
-            chunk = blob[start:end]
-            try:
-                decomp = gzip.decompress(chunk)
-                return start, end, decomp
-            except Exception:
-                continue
-
-    return None, None, None
+    return with_offsets(uint_view(blob, unit, count=max_count), unit)
 
 
 def main():
@@ -88,7 +38,15 @@ def main():
         action="store_true",
         help="Show full hexdump of the source file",
     )
+    parser.add_argument(
+        "--hex-range",
+        type=parse_range,
+        default=None,
+        metavar="START:LENGTH",
+        help="Only dump this range, e.g. 0x100:256 (implies --dump-hex)",
+    )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -102,7 +60,8 @@ def main():
 
     # 1. Header analysis
     safe_print("=== Header hexdump (first 0x50 bytes) ===")
-    safe_print(hex_dump(blob[:0x50]))
+    for line in hex_dump(blob, limit=0x50):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Header as 32-bit little endian integers ===")
@@ -115,9 +74,11 @@ def main():
         safe_print(f"  offset 0x{off:04X}: {val}")
     safe_print()
 
-    if args.dump_hex:
-        safe_print("=== Full hexdump of Global_ContentDocuments.bin ===")
-        safe_print(hex_dump(blob))
+    if args.dump_hex or args.hex_range is not None:
+        hex_start, hex_length = args.hex_range or (0, None)
+        safe_print("=== Hexdump of Global_ContentDocuments.bin ===")
+        for line in hex_dump(blob, start=hex_start, limit=hex_length):
+            safe_print(line)
         safe_print()
 
     # 2. Find gzip segment and decompress
@@ -141,7 +102,8 @@ def main():
 
     # 4. Inspect structure of decompressed block
     safe_print("=== Decompressed hex (all bytes) ===")
-    safe_print(hex_dump(decomp))
+    for line in hex_dump(decomp):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Decompressed as 32-bit little endian integers ===")
@@ -2,37 +2,26 @@ import argparse
 import binascii
 import pathlib
 import struct
-import sys
 import zlib
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+try:
+    import numpy as np
+except ImportError:  # summary mode needs numpy; full listings still work
+    np = None
 
+from rfa_gzip import DecompressionLimitError, inflate_bounded
+from rfa_hexdump import iter_hexdump
+from rfa_ints import u16_view, u32_view
+from rfa_output import emit_lines, report_writer, safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings
 
-def safe_print(text: str = ""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(STDOUT_ENCODING, errors="backslashreplace").decode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        )
-        print(safe)
-
-
-def emit_lines(lines, output_lines):
-    for line in lines:
-        safe_print(line)
-        output_lines.append(line)
-
-
-def hexdump(data: bytes, max_bytes: int = 256, width: int = 16):
-    data = data[:max_bytes]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hex_part = " ".join(f"{b:02X}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{i:08X}: {hex_part:<47}  {ascii_part}")
-    return lines
+# "auto" lists every value up to this many bytes and summarizes above it
+FULL_LISTING_LIMIT = 4096
+SUMMARY_TOP = 8
+SUMMARY_CHUNK = 1 << 20  # values per bincount / length-scan step
+# runs, strides, length prefixes and the u32 top values are looked for
+# in the first SUMMARY_WINDOW bytes; other counts cover the whole block
+SUMMARY_WINDOW = 8 << 20
 
 
 def parse_gzip_header(data: bytes):
@@ -87,9 +76,8 @@ def decompress_gzip_raw(data: bytes):
     if len(data) < start + 8:
         raise ValueError("Truncated gzip stream")
     payload = data[start:]
-    obj = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
-    out = obj.decompress(payload)
-    unused = obj.unused_data
+    out, end = inflate_bounded(payload)
+    unused = payload[end:] if end is not None else b""
     trailer = b""
     extra_after_trailer = b""
     if len(unused) >= 8:
@@ -106,54 +94,6 @@ def decompress_gzip_raw(data: bytes):
     return out, unused, extra_after_trailer, header, crc32, isize
 
 
-def extract_ascii_strings(data: bytes, min_len: int = 3):
-    results = []
-    current = bytearray()
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                results.append(current.decode("ascii", errors="ignore"))
-            current = bytearray()
-    if len(current) >= min_len:
-        results.append(current.decode("ascii", errors="ignore"))
-    return results
-
-
-def extract_utf16le_strings(data: bytes, min_len: int = 3):
-    results = []
-    current = []
-    i = 0
-    while i + 1 < len(data):
-        ch = data[i]
-        nul = data[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            if len(current) >= min_len:
-                results.append("".join(current))
-            current = []
-        i += 2
-    if len(current) >= min_len:
-        results.append("".join(current))
-    return results
-
-
-def format_u16_list(data: bytes):
-    values = []
-    for i in range(0, len(data) - 1, 2):
-        values.append(struct.unpack_from("<H", data, i)[0])
-    return values
-
-
-def format_u32_list(data: bytes):
-    values = []
-    for i in range(0, len(data) - 3, 4):
-        values.append(struct.unpack_from("<I", data, i)[0])
-    return values
-
-
 def try_decompress_variants(data: bytes):
     variants = []
     for label, wbits in [
@@ -162,37 +102,435 @@ def try_decompress_variants(data: bytes):
         ("gzip", 16 + zlib.MAX_WBITS),
     ]:
         try:
-            out = zlib.decompress(data, wbits=wbits)
-            variants.append((label, out))
+            out, end = inflate_bounded(data, wbits)
         except Exception:
-            pass
+            continue
+        if end is not None:
+            variants.append((label, out))
     return variants
 
 
+SCAN_VARIANTS = [
+    ("zlib", zlib.MAX_WBITS),
+    ("raw", -zlib.MAX_WBITS),
+    ("gzip", 16 + zlib.MAX_WBITS),
+]
+# candidate offsets are validated on this much input with at most this much
+# output before the full decompression is tried
+PROBE_INPUT = 256
+PROBE_OUTPUT = 4096
+# raw deflate candidates with a fixed-Huffman block are decoded this many
+# symbols ahead (vectorized) before they are probed
+FIXED_WALK_SYMBOLS = 16
+
+# deflate length / distance codes (RFC 1951, 3.2.5); 286-287 and 30-31 are
+# invalid and padded so that they can be indexed
+LENGTH_BASE = [
+    3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31,
+    35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258, 0, 0,
+]
+LENGTH_EXTRA = [0] * 8 + [k // 4 for k in range(4, 24)] + [0, 0, 0]
+DIST_BASE = [
+    1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193, 257, 385,
+    513, 769, 1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577, 0, 0,
+]
+DIST_EXTRA = [0, 0, 0, 0] + [k // 2 for k in range(2, 28)] + [0, 0]
+
+
+def _header_checks(b0, b1, b2, b3, b4):
+    """
+    (zlib, raw, gzip) tests for a stream starting with bytes b0..b4 (-1
+    past the end of the data). Written with & and | so that it works both
+    on ints and on numpy arrays of every offset at once.
+
+    zlib: CM 8, window at most 32K, FCHECK ok, no preset dictionary.
+    raw deflate: block type 3 is reserved, a stored block needs NLEN ==
+    ~LEN, a dynamic block at most 286 literal/length and 30 distance codes.
+    gzip: 1F 8B 08.
+    """
+    zlib_ok = (
+        (b1 >= 0) & (b0 & 0x0F == 8) & (b0 >> 4 <= 7)
+        & (b1 & 0x20 == 0) & ((b0 << 8 | b1) % 31 == 0)
+    )
+    btype = b0 >> 1 & 3
+    raw_ok = (
+        (btype == 1)
+        | (btype == 0) & (b4 >= 0) & (b1 ^ b3 == 0xFF) & (b2 ^ b4 == 0xFF)
+        | (btype == 2) & (b0 >> 3 <= 29) & (b1 >= 0) & (b1 & 0x1F <= 29)
+    )
+    gzip_ok = (b0 == 0x1F) & (b1 == 0x8B) & (b2 == 0x08)
+    return zlib_ok, raw_ok, gzip_ok
+
+
+def _reversed_code(code: int, bits: int):
+    """A Huffman code as it appears in the LSB-first deflate bit stream."""
+    return int(f"{code:0{bits}b}"[::-1], 2)
+
+
+def _fixed_tables():
+    """
+    Fixed-Huffman decode tables indexed by the next 9 (literal/length) or
+    5 (distance) stream bits: (symbol, code length) and distance symbol.
+    """
+    symbol = np.zeros(512, dtype=np.int64)
+    used = np.zeros(512, dtype=np.int64)
+    for sym in range(288):
+        if sym < 144:
+            code, bits = 0x30 + sym, 8
+        elif sym < 256:
+            code, bits = 0x190 + sym - 144, 9
+        elif sym < 280:
+            code, bits = sym - 256, 7
+        else:
+            code, bits = 0xC0 + sym - 280, 8
+        index = _reversed_code(code, bits) + (np.arange(1 << (9 - bits)) << bits)
+        symbol[index] = sym
+        used[index] = bits
+    dist = np.array([_reversed_code(code, 5) for code in range(32)]).argsort()
+    return symbol, used, dist
+
+
+def _stream_words(data):
+    """words[i] = the 8 bytes at data[i:] as a little-endian uint64."""
+    n = len(data)
+    padded = np.zeros(n + 16, dtype=np.uint64)
+    padded[:n] = np.frombuffer(data, dtype=np.uint8)
+    words = np.zeros(n + 8, dtype=np.uint64)
+    for k in range(8):
+        words |= padded[k : k + n + 8] << np.uint64(8 * k)
+    return words
+
+
+def _bits_at(words, pos):
+    """At least 57 stream bits starting at bit positions pos (LSB first)."""
+    return words[pos >> 3] >> (pos & 7).astype(np.uint64)
+
+
+def _field(bits, shift, width):
+    """width-bit fields at per-element bit offsets shift of bits, as int64."""
+    shift = np.asarray(shift).astype(np.uint64)
+    mask = (np.uint64(1) << np.asarray(width).astype(np.uint64)) - np.uint64(1)
+    return (bits >> shift & mask).astype(np.int64)
+
+
+def _dynamic_block_ok(words, starts, end_bit: int):
+    """
+    Dynamic-Huffman block at starts: the code length code must be complete
+    (Kraft sum exactly 1) or empty, and fit in the data.
+    """
+    pos = starts * 8 + 3
+    hclen = _field(_bits_at(words, pos), 10, 4) + 4
+    lengths = _bits_at(words, pos + 14)
+    kraft = np.zeros(starts.size, dtype=np.int64)
+    for j in range(19):
+        length = _field(lengths, 3 * j, 3)
+        kraft += np.where((j < hclen) & (length > 0), 128 >> length, 0)
+    return ((kraft == 128) | (kraft == 0)) & (pos + 14 + 3 * hclen <= end_bit)
+
+
+def _fixed_block_ok(words, starts, end_bit: int):
+    """
+    Decode the first FIXED_WALK_SYMBOLS symbols of a fixed-Huffman block
+    at each of starts, as inflate would, and drop the starts where inflate
+    is bound to fail: an invalid code, a distance further back than the
+    output so far, or a symbol running past the end of the data. Starts
+    that reach the end of the block or survive the walk are kept.
+    """
+    symbol_of, used_of, dist_of = _fixed_tables()
+    length_base, length_extra = np.array(LENGTH_BASE), np.array(LENGTH_EXTRA)
+    dist_base, dist_extra = np.array(DIST_BASE), np.array(DIST_EXTRA)
+    ok = np.ones(starts.size, dtype=bool)
+    active = np.arange(starts.size)
+    pos = starts * 8 + 3
+    out = np.zeros(starts.size, dtype=np.int64)
+    for _ in range(FIXED_WALK_SYMBOLS):
+        if not active.size:
+            break
+        p, o = pos[active], out[active]
+        bits = _bits_at(words, p)
+        code = _field(bits, 0, 9)
+        sym, used = symbol_of[code], used_of[code]
+        is_match = sym > 256
+        li = np.clip(sym - 257, 0, 30)
+        length = length_base[li] + _field(bits, used, length_extra[li])
+        after_length = used + length_extra[li]
+        dcode = dist_of[_field(bits, after_length, 5)]
+        dist = dist_base[dcode] + _field(bits, after_length + 5, dist_extra[dcode])
+        used = np.where(is_match, after_length + 5 + dist_extra[dcode], used)
+        bad = (
+            (p + used > end_bit) | (sym >= 286)
+            | is_match & ((dcode >= 30) | (dist > o))
+        )
+        ok[active[bad]] = False
+        going = ~bad & (sym != 256)
+        active = active[going]
+        pos[active] = (p + used)[going]
+        out[active] = (o + np.where(is_match, length, 1))[going]
+    return ok
+
+
+def _raw_deflate_ok(data, starts):
+    """Deeper raw deflate checks for the header candidates at starts."""
+    if not starts.size:
+        return np.ones(0, dtype=bool)
+    words = _stream_words(data)
+    btype = np.frombuffer(data, dtype=np.uint8)[starts] >> 1 & 3
+    ok = np.ones(starts.size, dtype=bool)
+    for kind, check in ((1, _fixed_block_ok), (2, _dynamic_block_ok)):
+        sel = np.flatnonzero(btype == kind)
+        ok[sel] = check(words, starts[sel], len(data) * 8)
+    return ok
+
+
+def scan_candidates(data):
+    """
+    {offset: [labels]} for the offsets where a zlib, raw deflate or gzip
+    stream could start, judged by its header (see _header_checks).
+    Vectorized over all offsets with numpy, per offset without it; with
+    numpy, raw deflate candidates are also checked past the block header
+    (_raw_deflate_ok).
+    """
+    n = len(data)
+    labels = [label for label, _ in SCAN_VARIANTS]
+    found = {}
+    if np is None:
+        padded = list(data) + [-1] * 4
+        for i in range(n):
+            checks = _header_checks(*padded[i : i + 5])
+            hit = [label for label, ok in zip(labels, checks) if ok]
+            if hit:
+                found[i] = hit
+        return found
+    padded = np.full(n + 4, -1, dtype=np.int32)
+    padded[:n] = np.frombuffer(data, dtype=np.uint8)
+    checks = _header_checks(*(padded[k : k + n] for k in range(5)))
+    for label, mask in zip(labels, checks):
+        starts = np.flatnonzero(mask)
+        if label == "raw":
+            starts = starts[_raw_deflate_ok(data, starts)]
+        for i in starts.tolist():
+            found.setdefault(i, []).append(label)
+    return found
+
+
 def scan_for_streams(data: bytes, min_out_len: int = 4):
+    """
+    (offset, label, output) for every offset where a complete zlib, raw
+    deflate or gzip stream decompresses to at least min_out_len bytes.
+
+    Trying every offset with three full decompressions is quadratic, so
+    offsets are pre-filtered (scan_candidates), then probed with a
+    decompressobj on PROBE_INPUT bytes and at most PROBE_OUTPUT bytes of
+    output. Only candidates still valid after the probe are fully
+    decompressed. The filters only drop offsets where decompression is
+    bound to fail, so the hits are the same as trying every offset;
+    streams exceeding the rfa_gzip limits are not reported.
+    """
     hits = []
-    for i in range(0, len(data)):
-        chunk = data[i:]
-        for label, wbits in [
-            ("zlib", zlib.MAX_WBITS),
-            ("raw", -zlib.MAX_WBITS),
-            ("gzip", 16 + zlib.MAX_WBITS),
-        ]:
+    view = memoryview(data)
+    wbits_of = dict(SCAN_VARIANTS)
+    candidates = scan_candidates(data)
+    for i in sorted(candidates):
+        for label in candidates[i]:
+            wbits = wbits_of[label]
             try:
-                out = zlib.decompress(chunk, wbits=wbits)
-                if len(out) >= min_out_len:
-                    hits.append((i, label, out))
-            except Exception:
-                pass
+                probe = zlib.decompressobj(wbits)
+                probe.decompress(view[i : i + PROBE_INPUT], PROBE_OUTPUT)
+                out, end = inflate_bounded(view[i:], wbits)
+            except (zlib.error, DecompressionLimitError):
+                continue
+            if end is not None and len(out) >= min_out_len:
+                hits.append((i, label, out))
     return hits
 
 
-def heuristic_parse_block(data: bytes, emit):
+def use_summary(data, values: str = "auto"):
+    """Whether a block is summarized ("summary"/"auto") or fully listed."""
+    if values == "full":
+        return False
+    return values == "summary" or len(data) > FULL_LISTING_LIMIT
+
+
+def _longest_run(mask):
+    """(start index, length) of the longest run of True in a bool array."""
+    if not mask.size:
+        return 0, 0
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    if not starts.size:
+        return 0, 0
+    lengths = np.flatnonzero(edges == -1) - starts
+    i = int(lengths.argmax())
+    return int(starts[i]), int(lengths[i])
+
+
+def _stride_candidates(values, markers, width: int):
+    """
+    For each marker value, the most common distance between its
+    occurrences: (stride in bytes, marker, share of gaps, occurrences).
+    """
+    found = []
+    for marker in markers:
+        pos = np.flatnonzero(values == marker)
+        if pos.size < 3:
+            continue
+        gaps = np.diff(pos)
+        counts = np.bincount(gaps) if gaps.max() < 1 << 20 else None
+        if counts is not None:
+            gap = int(counts.argmax())
+            share = counts[gap] / gaps.size
+        else:
+            uniq, uniq_counts = np.unique(gaps, return_counts=True)
+            gap = int(uniq[uniq_counts.argmax()])
+            share = uniq_counts.max() / gaps.size
+        found.append((gap * width, int(marker), float(share), int(pos.size)))
+    found.sort(key=lambda item: -item[2])
+    return found
+
+
+def summarize_values(data, width: int):
+    """
+    Vectorized statistics over data read as little-endian u16 (width 2)
+    or u32 (width 4) values; a trailing partial value is ignored.
+    Counts and the u16 histogram cover every value; the u32 top values
+    (any magnitude), runs and stride candidates the first SUMMARY_WINDOW
+    bytes. Every step is a whole-array NumPy operation, so 100 MB stays
+    under a second.
+    """
+    count = len(data) // width
+    values = np.frombuffer(data, dtype=f"<u{width}", count=count)
+    all_ones = (1 << 8 * width) - 1
+    summary = {
+        "count": count,
+        "zeros": int(np.count_nonzero(values == 0)),
+        "all_ones": int(np.count_nonzero(values == all_ones)),
+        "min": int(values.min()) if count else None,
+        "max": int(values.max()) if count else None,
+    }
+
+    head = values[: SUMMARY_WINDOW // width]
+    if width == 2:
+        # chunked, so bincount's cast to intp never copies the whole block
+        counts = np.zeros(0x10000, dtype=np.int64)
+        for base in range(0, count, SUMMARY_CHUNK):
+            chunk = values[base : base + SUMMARY_CHUNK]
+            counts += np.bincount(chunk, minlength=0x10000)
+        uniques = np.arange(0x10000)
+    else:
+        # u32 values do not fit a histogram; count the window's distinct ones
+        uniques, counts = np.unique(head, return_counts=True)
+    top = np.argsort(counts, kind="stable")[::-1][:SUMMARY_TOP]
+    summary["top_values"] = [
+        (int(uniques[i]), int(counts[i])) for i in top if counts[i]
+    ]
+    summary["large_values"] = int(np.count_nonzero(values >= 0x10000))
+
+    prev, cur = head[:-1], head[1:]
+    summary["increasing_run"] = _longest_run(cur > prev)
+    summary["counter_run"] = _longest_run((cur == prev + 1) & (prev != all_ones))
+
+    markers = [v for v, _ in summary["top_values"] if v not in (0, all_ones)][:3]
+    summary["strides"] = _stride_candidates(head, markers, width)
+    return summary
+
+
+def find_length_candidates(data, limit: int = SUMMARY_TOP):
+    """
+    u32 values (at 4-byte aligned offsets) that could be offsets or
+    lengths inside the block: how many are in range (whole block), plus
+    the offsets of values equal to the number of bytes after them or to
+    the block size (first SUMMARY_WINDOW bytes).
+    """
+    size = len(data)
+    values = np.frombuffer(data, dtype="<u4", count=size // 4)
+    in_range = int(np.count_nonzero((values > 0) & (values < size)))
+    rest_of_block = []
+    block_size = []
+    for base in range(0, min(values.size, SUMMARY_WINDOW // 4), SUMMARY_CHUNK):
+        chunk = values[base : base + SUMMARY_CHUNK].astype(np.int64)
+        offsets = (base + np.arange(chunk.size, dtype=np.int64)) * 4
+        if len(rest_of_block) < limit:
+            hits = np.flatnonzero((chunk == size - offsets - 4) & (chunk > 0))
+            rest_of_block.extend(int(offsets[i]) for i in hits[:limit])
+        if len(block_size) < limit:
+            hits = np.flatnonzero(chunk == size)
+            block_size.extend(int(offsets[i]) for i in hits[:limit])
+    return {
+        "in_range": in_range,
+        "rest_of_block": rest_of_block[:limit],
+        "block_size": block_size[:limit],
+    }
+
+
+def emit_value_summary(data, emit):
+    if len(data) > SUMMARY_WINDOW:
+        emit(
+            f"  (u32 top values, runs, strides and length prefixes: "
+            f"first {SUMMARY_WINDOW} bytes)"
+        )
+    for width, name in ((2, "u16"), (4, "u32")):
+        if len(data) < width:
+            continue
+        summary = summarize_values(data, width)
+        emit(
+            f"  {name}: {summary['count']} values, {summary['zeros']} zero, "
+            f"{summary['all_ones']} all-ones, "
+            f"min {summary['min']}, max {summary['max']}"
+        )
+        emit("    top values: " + ", ".join(
+            f"{v} ({n})" for v, n in summary["top_values"]
+        ))
+        if width == 4:
+            emit(f"    values >= 0x10000: {summary['large_values']}")
+        for label, key in (("increasing", "increasing_run"), ("+1 counter", "counter_run")):
+            start, length = summary[key]
+            if length:
+                emit(
+                    f"    longest {label} run: {length + 1} values "
+                    f"at 0x{start * width:X}"
+                )
+        for stride, marker, share, hits in summary["strides"]:
+            emit(
+                f"    stride candidate: {stride} bytes "
+                f"(value {marker}, {hits} hits, {share:.0%} of gaps)"
+            )
+
+    if len(data) >= 4:
+        lengths = find_length_candidates(data)
+        emit(f"  u32 in range 1..{len(data) - 1} (offset/length-like): "
+             f"{lengths['in_range']}")
+        if lengths["rest_of_block"]:
+            emit("    = bytes after it at: " + ", ".join(
+                f"0x{off:X}" for off in lengths["rest_of_block"]
+            ))
+        if lengths["block_size"]:
+            emit("    = block size at: " + ", ".join(
+                f"0x{off:X}" for off in lengths["block_size"]
+            ))
+
+
+def heuristic_parse_block(data: bytes, emit, values: str = "auto"):
+    """
+    Describe a block as u16/u32 values. Small blocks (or values="full")
+    list every value, flat and indexed; larger blocks (or
+    values="summary") get a vectorized statistical summary instead.
+    """
+    if use_summary(data, values):
+        emit("Heuristic parse (summary):")
+        emit(f"  length: {len(data)} bytes")
+        if np is None:
+            emit("  (numpy is not installed; summary not available)")
+        else:
+            emit_value_summary(data, emit)
+        _emit_leading_u32(data, emit)
+        emit()
+        return
+
     emit("Heuristic parse:")
     emit(f"  length: {len(data)} bytes")
 
     if len(data) % 2 == 0:
-        u16 = format_u16_list(data)
+        u16 = u16_view(data)
         zeros = sum(1 for v in u16 if v == 0)
         ffff = sum(1 for v in u16 if v == 0xFFFF)
         emit(f"  u16 count: {len(u16)}")
@@ -206,7 +544,7 @@ def heuristic_parse_block(data: bytes, emit):
             emit(f"    [{i}] = {v}")
 
     if len(data) % 4 == 0:
-        u32 = format_u32_list(data)
+        u32 = u32_view(data)
         emit(f"  u32 count: {len(u32)}")
         emit("  u32 values:")
         emit("    " + " ".join(f"{v}" for v in u32))
@@ -215,6 +553,11 @@ def heuristic_parse_block(data: bytes, emit):
         for i, v in enumerate(u32):
             emit(f"    [{i}] = {v}")
 
+    _emit_leading_u32(data, emit)
+    emit()
+
+
+def _emit_leading_u32(data, emit):
     if len(data) >= 12:
         a, b, c = struct.unpack_from("<III", data, 0)
         emit(f"  u32[0..2]: {a}, {b}, {c}")
@@ -225,39 +568,19 @@ def heuristic_parse_block(data: bytes, emit):
         a = struct.unpack_from("<I", data, 0)[0]
         emit(f"  u32[0]: {a}")
 
-    emit()
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Decode Global_ContentDocuments.bin from an RFA unpack."
-    )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        default=r"racbasicsamplefamily\Global_ContentDocuments.bin",
-        help="Path to Global_ContentDocuments.bin",
-    )
-    args = parser.parse_args()
-
-    path = pathlib.Path(args.path)
-    if not path.exists():
-        safe_print(f"File not found: {path}")
-        return 1
-
-    blob = path.read_bytes()
-    output_lines = []
-
-    def emit(text: str = ""):
-        safe_print(text)
-        output_lines.append(text)
 
+def write_report(path: pathlib.Path, blob: bytes, emit, values: str = "auto"):
+    """
+    Emit the full report line by line; returns an error message or None.
+    values ("auto", "full", "summary") controls whether the decompressed
+    block is listed value by value or summarized (see use_summary).
+    """
     emit(f"File: {path}")
     emit(f"Size: {len(blob)} bytes")
     emit()
 
     emit("File hexdump (first 256 bytes):")
-    emit_lines(hexdump(blob, max_bytes=256), output_lines)
+    emit_lines(iter_hexdump(blob, length=256), emit)
     emit()
 
     if len(blob) >= 8:
@@ -277,11 +600,7 @@ def main():
             )
         except Exception as exc:
             emit(f"Decompression failed: {exc}")
-            output_dir = pathlib.Path(__file__).resolve().parent
-            output_path = output_dir / "Global_ContentDocuments_V3_Readable.txt"
-            output_path.write_text("\n".join(output_lines), encoding="utf-8")
-            emit(f"Saved: {output_path}")
-            return 1
+            return f"Decompression failed: {exc}"
 
         emit("GZip header:")
         emit(f"  cm: {header['cm']}")
@@ -303,45 +622,50 @@ def main():
         emit(f"Computed crc32: 0x{(zlib.crc32(data) & 0xFFFFFFFF):08X}")
         emit()
 
-        emit("Decompressed hexdump (all bytes):")
-        emit_lines(hexdump(data, max_bytes=len(data)), output_lines)
-        emit()
-
-        emit("Decompressed bytes (u8):")
-        emit("  " + " ".join(f"{b:02X}" for b in data))
-        emit()
-
-        u16_values = format_u16_list(data)
-        if u16_values:
-            emit("Decompressed u16 (little-endian):")
-            emit("  " + " ".join(str(v) for v in u16_values))
+        if use_summary(data, values):
+            emit(f"Decompressed hexdump (first {FULL_LISTING_LIMIT} bytes):")
+            emit_lines(iter_hexdump(data, length=FULL_LISTING_LIMIT), emit)
+            emit()
+        else:
+            emit("Decompressed hexdump (all bytes):")
+            emit_lines(iter_hexdump(data), emit)
             emit()
 
-        u32_values = format_u32_list(data)
-        if u32_values:
-            emit("Decompressed u32 (little-endian):")
-            emit("  " + " ".join(str(v) for v in u32_values))
+            emit("Decompressed bytes (u8):")
+            emit("  " + " ".join(f"{b:02X}" for b in data))
             emit()
 
-        heuristic_parse_block(data, emit)
+            u16_values = u16_view(data)
+            if u16_values:
+                emit("Decompressed u16 (little-endian):")
+                emit("  " + " ".join(str(v) for v in u16_values))
+                emit()
+
+            u32_values = u32_view(data)
+            if u32_values:
+                emit("Decompressed u32 (little-endian):")
+                emit("  " + " ".join(str(v) for v in u32_values))
+                emit()
+
+        heuristic_parse_block(data, emit, values)
 
-        utf16_strings = extract_utf16le_strings(data, min_len=3)
+        utf16_strings = utf16le_strings(data, min_len=3)
         if utf16_strings:
             emit("UTF-16LE strings:")
             for s in utf16_strings:
                 emit(f"  {s}")
             emit()
 
-        ascii_strings = extract_ascii_strings(data, min_len=3)
-        if ascii_strings:
+        ascii_found = ascii_strings(data, min_len=3)
+        if ascii_found:
             emit("ASCII strings:")
-            for s in ascii_strings:
+            for s in ascii_found:
                 emit(f"  {s}")
             emit()
 
         if unused:
             emit("Unused data after deflate stream (hex):")
-            emit_lines(hexdump(unused, max_bytes=len(unused)), output_lines)
+            emit_lines(iter_hexdump(unused), emit)
             emit()
 
             variants = try_decompress_variants(unused)
@@ -362,17 +686,57 @@ def main():
 
         if extra_after_trailer:
             emit("Extra bytes after trailer (hex):")
-            emit_lines(hexdump(extra_after_trailer, max_bytes=len(extra_after_trailer)), output_lines)
+            emit_lines(iter_hexdump(extra_after_trailer), emit)
             emit()
     else:
         emit("No gzip signature found.")
 
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Global_ContentDocuments.bin from an RFA unpack."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily\Global_ContentDocuments.bin",
+        help="Path to Global_ContentDocuments.bin",
+    )
+    parser.add_argument(
+        "--echo",
+        action="store_true",
+        help="Also print the full report to the console",
+    )
+    parser.add_argument(
+        "--values",
+        choices=("auto", "full", "summary"),
+        default="auto",
+        help="List every u8/u16/u32 value of the decompressed block (full), "
+             "print a vectorized statistical summary (summary), or list "
+             f"blocks up to {FULL_LISTING_LIMIT} bytes and summarize larger "
+             "ones (auto, default)",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    path = pathlib.Path(args.path)
+    if not path.exists():
+        safe_print(f"File not found: {path}")
+        return 1
+
+    blob = path.read_bytes()
     output_dir = pathlib.Path(__file__).resolve().parent
     output_path = output_dir / "Global_ContentDocuments_V3_Readable.txt"
-    output_path.write_text("\n".join(output_lines), encoding="utf-8")
-    emit(f"Saved: {output_path}")
-
-    return 0
+    echo = safe_print if args.echo else None
+    with report_writer(output_path, echo=echo) as emit:
+        error = write_report(path, blob, emit, args.values)
+    if error and not args.echo:
+        safe_print(error)
+    safe_print(f"Saved: {output_path}")
+
+    return 1 if error else 0
 
 
 if __name__ == "__main__":
@@ -1,35 +1,19 @@
 import argparse
-import gzip
 import pathlib
 import re
-import struct
-import sys
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+from rfa_gzip import find_and_decompress_gzip
+from rfa_hexdump import iter_hexdump, parse_range
+from rfa_ints import u32_pairs, uint_view, with_offsets
+from rfa_output import safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings_all_alignments
 
 
-def safe_print(text: str = ""):
-    """Print without the console crashing on odd Unicode."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        alt = text.encode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        ).decode(STDOUT_ENCODING, errors="backslashreplace")
-        print(alt)
-
-
-def hex_dump(data: bytes, width: int = 16, limit: int | None = None) -> str:
-    """Simple hexdump helper."""
-    if limit is not None:
-        data = data[:limit]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hexs = " ".join(f"{b:02X}" for b in chunk)
-        ascii_s = "".join(chr(b) if 32 <= b <= 126 else "." for b in chunk)
-        lines.append(f"{i:04X}  {hexs:<{width*3}}  {ascii_s}")
-    return "\n".join(lines)
+def hex_dump(data, width: int = 16, start: int = 0, limit: int | None = None):
+    """Lazy hexdump lines of data[start:start + limit]."""
+    return iter_hexdump(
+        data, start, limit, width=width, offset_format="{:04X}  ", pad=width * 3
+    )
 
 
 def parse_uints_le(blob: bytes, unit: int, max_count: int):
@@ -37,71 +21,7 @@ def parse_uints_le(blob: bytes, unit: int, max_count: int):
     Interpret the first bytes as little endian integers:
     unit = 2 (uint16) or 4 (uint32).
     """
-    count = min(max_count, len(blob) // unit)
-    vals = []
-    fmt = "<H" if unit == 2 else "<I"
-    for i in range(count):
-        off = i * unit
-        val = struct.unpack_from(fmt, blob, off)[0]
-        vals.append((off, val))
-    return vals
-
-
-def ascii_strings_from_bytes(blob: bytes, min_len: int = 4):
-    """Search for normal ASCII strings in raw bytes."""
-    results = []
-    cur = bytearray()
-
-    def flush():
-        nonlocal cur
-        if len(cur) >= min_len:
-            results.append(cur.decode("ascii", errors="ignore"))
-        cur = bytearray()
-
-    for b in blob:
-        if 32 <= b <= 126:
-            cur.append(b)
-        else:
-            flush()
-    flush()
-    return results
-
-
-def utf16le_strings_all_alignments(blob: bytes, min_len: int = 4):
-    """
-    Search for UTF-16LE strings at both possible alignments (offset 0 and 1).
-    This captures as much readable text as possible.
-    """
-    results = []
-
-    for start in (0, 1):
-        cur = []
-
-        def flush():
-            nonlocal cur
-            if len(cur) >= min_len:
-                results.append("".join(cur))
-            cur = []
-
-        i = start
-        while i + 1 < len(blob):
-            ch = blob[i]
-            nul = blob[i + 1]
-            if 32 <= ch <= 126 and nul == 0:
-                cur.append(chr(ch))
-            else:
-                flush()
-            i += 2
-        flush()
-
-    # dedup
-    uniq = []
-    seen = set()
-    for s in results:
-        if s not in seen:
-            uniq.append(s)
-            seen.add(s)
-    return uniq
+    return with_offsets(uint_view(blob, unit, count=max_count), unit)
 
 
 def extract_guids(text: str):
@@ -115,45 +35,15 @@ def extract_guids(text: str):
     return sorted(set(pat.findall(text)))
 
 
-def find_and_decompress_gzip(blob: bytes):
-    """
-    Search for a gzip header (1F 8B 08) and try to decompress a valid
-    gzip block by moving the end backward.
-
-    Returns (start_offset, end_offset, decompressed_bytes)
-    or (None, None, None) if nothing succeeds.
-    """
-    magic = b"\x1f\x8b\x08"
-
-    for start in range(len(blob) - 2):
-        if blob[start : start + 3] != magic:
-            continue
-
-        # move the end backward until gzip.decompress succeeds
-        for end in range(len(blob), start + 10, -1):
-            chunk = blob[start:end]
-            try:
-                decomp = gzip.decompress(chunk)
-                return start, end, decomp
-            except Exception:
-                continue
-
-    return None, None, None
-
-
 def inspect_uint32_pairs(decomp: bytes, max_pairs: int = 16):
     """
     Interpret decompressed data as a table of (uint32, uint32) pairs.
     Handy for something called 'DocumentIncrementTable'.
     """
-    pairs = []
-    pair_size = 8
-    total_pairs = min(max_pairs, len(decomp) // pair_size)
-    for i in range(total_pairs):
-        off = i * pair_size
-        a, b = struct.unpack_from("<II", decomp, off)
-        pairs.append((off, a, b))
-    return pairs
+    return [
+        (i * 8, a, b)
+        for i, (a, b) in enumerate(u32_pairs(decomp, count=max_pairs))
+    ]
 
 
 def main():
@@ -172,7 +62,15 @@ def main():
         action="store_true",
         help="Show full hexdump of the source file",
     )
+    parser.add_argument(
+        "--hex-range",
+        type=parse_range,
+        default=None,
+        metavar="START:LENGTH",
+        help="Only dump this range, e.g. 0x100:256 (implies --dump-hex)",
+    )
     args = parser.parse_args()
+    setup_console()
 
     path = pathlib.Path(args.path)
     if not path.exists():
@@ -186,7 +84,8 @@ def main():
 
     # 1. Header analysis
     safe_print("=== Header hexdump (first 0x80 bytes) ===")
-    safe_print(hex_dump(blob[:0x80]))
+    for line in hex_dump(blob, limit=0x80):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Header as 32-bit little endian integers ===")
@@ -199,9 +98,11 @@ def main():
         safe_print(f"  offset 0x{off:04X}: {val}")
     safe_print()
 
-    if args.dump_hex:
-        safe_print("=== Full hexdump of Global_DocumentIncrementTable.bin ===")
-        safe_print(hex_dump(blob))
+    if args.dump_hex or args.hex_range is not None:
+        hex_start, hex_length = args.hex_range or (0, None)
+        safe_print("=== Hexdump of Global_DocumentIncrementTable.bin ===")
+        for line in hex_dump(blob, start=hex_start, limit=hex_length):
+            safe_print(line)
         safe_print()
 
     # 2. Find gzip segment and decompress
@@ -225,7 +126,8 @@ def main():
 
     # 4. Decompressed hexdump
     safe_print("=== Decompressed hex (first 0x80 bytes) ===")
-    safe_print(hex_dump(decomp, limit=0x80))
+    for line in hex_dump(decomp, limit=0x80):
+        safe_print(line)
     safe_print()
 
     safe_print("=== Decompressed as 32-bit little endian integers (first 16) ===")
@@ -245,7 +147,7 @@ def main():
 
     # 6. Strings and GUIDs from decompressed data
     utf16 = utf16le_strings_all_alignments(decomp, min_len=4)
-    ascii_s = ascii_strings_from_bytes(decomp, min_len=4)
+    ascii_s = ascii_strings(decomp, min_len=4)
 
     safe_print("=== UTF-16-LE strings (all alignments) ===")
     if utf16:
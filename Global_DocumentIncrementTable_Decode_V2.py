@@ -0,0 +1,246 @@
+import argparse
+import datetime
+import json
+import pathlib
+import struct
+from array import array
+
+from rfa_gzip import find_and_decompress_gzip
+from rfa_output import safe_print, setup_console
+
+STREAM_NAME = "Global/DocumentIncrementTable"
+
+# Per-record columns, stored as compact typed arrays (one value per record).
+#   user        index into the user table
+#   increment   document increment number of the save
+#   increment_2 second increment (often increment + 1, 0 in old records)
+#   timestamp   save time, unix seconds (0 in the oldest records)
+#   sequence    running number in newer records
+#   flag        trailing byte of the record
+#   offset      record offset in the decompressed payload
+INCREMENT_COLUMNS = {
+    "user": "I",
+    "increment": "I",
+    "increment_2": "Q",
+    "timestamp": "I",
+    "sequence": "Q",
+    "flag": "B",
+    "offset": "I",
+}
+
+# after the user name: u32 0, u32 increment, u64 increment_2,
+# u32 timestamp, u64 sequence, 12 x i32 (not decoded), u8 flag
+RECORD_TAIL = struct.Struct("<IIQIQ48xB")
+
+
+def read_increment_stream(path: pathlib.Path):
+    """Raw Global/DocumentIncrementTable bytes from a .bin or an .rfa/.rvt."""
+    if path.suffix.lower() in (".rfa", ".rvt", ".rte", ".rft"):
+        import olefile
+
+        with olefile.OleFileIO(str(path)) as ole:
+            if not ole.exists(STREAM_NAME):
+                raise ValueError(f"No {STREAM_NAME} stream")
+            return ole.openstream(STREAM_NAME).read()
+    return path.read_bytes()
+
+
+def parse_increment_records(data: bytes, pos: int, users: list, user_ids: dict):
+    """
+    Parse one table (u32 count + records) starting at pos.
+
+    Record layout as observed in the samples:
+      u32 k, k x u64, u32 name length, UTF-16LE user name, RECORD_TAIL.
+
+    New user names are appended to users/user_ids.
+    Returns (columns, end position).
+    """
+    columns = {name: array(code) for name, code in INCREMENT_COLUMNS.items()}
+    count = struct.unpack_from("<I", data, pos)[0]
+    pos += 4
+    view = memoryview(data)
+    try:
+        for _ in range(count):
+            start = pos
+            k = struct.unpack_from("<I", data, pos)[0]
+            pos += 4 + 8 * k
+            name_len = struct.unpack_from("<I", data, pos)[0]
+            pos += 4
+            name = str(view[pos : pos + 2 * name_len], "utf-16-le")
+            pos += 2 * name_len
+            _, increment, increment_2, timestamp, sequence, flag = (
+                RECORD_TAIL.unpack_from(data, pos)
+            )
+            pos += RECORD_TAIL.size
+
+            user = user_ids.get(name)
+            if user is None:
+                user = user_ids[name] = len(users)
+                users.append(name)
+            columns["user"].append(user)
+            columns["increment"].append(increment)
+            columns["increment_2"].append(increment_2)
+            columns["timestamp"].append(timestamp)
+            columns["sequence"].append(sequence)
+            columns["flag"].append(flag)
+            columns["offset"].append(start)
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise ValueError(
+            f"Increment record {len(columns['user'])} at 0x{start:X} "
+            f"is truncated or malformed: {exc}"
+        ) from exc
+    return columns, pos
+
+
+def parse_document_increments(data: bytes):
+    """
+    One pass over the decompressed payload:
+    u16 header, then tables (u32 count + records) until the zero padding.
+    The samples hold two identical copies of the table.
+
+    Returns {"header", "tables": [columns, ...], "users": [names],
+    "user_counts": [records per user in the first table], "trailer"}.
+    """
+    if len(data) < 6:
+        raise ValueError("DocumentIncrementTable payload too short")
+    header = struct.unpack_from("<H", data, 0)[0]
+    users = []
+    user_ids = {}
+    tables = []
+    pos = 2
+    while pos + 4 <= len(data):
+        if struct.unpack_from("<I", data, pos)[0] == 0:
+            break
+        columns, pos = parse_increment_records(data, pos, users, user_ids)
+        tables.append(columns)
+
+    user_counts = array("I", bytes(4 * len(users)))
+    if tables:
+        for user in tables[0]["user"]:
+            user_counts[user] += 1
+    return {
+        "header": header,
+        "tables": tables,
+        "users": users,
+        "user_counts": user_counts,
+        "trailer": data[pos:],
+    }
+
+
+def format_timestamp(ts: int) -> str:
+    if not ts:
+        return "-"
+    return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+
+def summarize_increments(table: dict):
+    """Records, users with their save counts and first/last save time."""
+    records = table["tables"][0] if table["tables"] else None
+    stamps = [ts for ts in records["timestamp"] if ts] if records else []
+    return {
+        "records": len(records["user"]) if records else 0,
+        "users": {u: c for u, c in zip(table["users"], table["user_counts"]) if u},
+        "first_save": format_timestamp(min(stamps)) if stamps else None,
+        "last_save": format_timestamp(max(stamps)) if stamps else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Global_DocumentIncrementTable into increment "
+                    "records and a per-user table."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily/Global_DocumentIncrementTable.bin",
+        help="Path to Global_DocumentIncrementTable.bin or an .rfa/.rvt "
+             "(default: racbasicsamplefamily/Global_DocumentIncrementTable.bin)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON line (users with counts, first/last save) instead",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    path = pathlib.Path(args.path)
+    if not path.exists():
+        safe_print(f"File not found: {path}")
+        return 1
+
+    blob = read_increment_stream(path)
+    _, _, decomp = find_and_decompress_gzip(blob)
+    if decomp is None:
+        safe_print("No valid gzip segment found in Global_DocumentIncrementTable")
+        return 1
+    try:
+        table = parse_document_increments(decomp)
+    except ValueError as exc:
+        safe_print(f"{path}: {exc}")
+        return 1
+
+    users = table["users"]
+    records = table["tables"][0] if table["tables"] else None
+    stamps = [ts for ts in records["timestamp"] if ts] if records else []
+
+    if args.json:
+        safe_print(json.dumps(
+            {"path": str(path), **summarize_increments(table)},
+            ensure_ascii=False,
+        ))
+        return 0
+
+    safe_print(f"File: {path}")
+    safe_print(f"Decompressed size: {len(decomp)} bytes")
+    safe_print(f"Header u16: {table['header']}")
+    safe_print(
+        "Tables: " + ", ".join(str(len(t["user"])) for t in table["tables"])
+        + " records"
+    )
+    if any(
+        t[col] != records[col]
+        for t in table["tables"][1:]
+        for col in INCREMENT_COLUMNS
+        if col != "offset"
+    ):
+        safe_print("Note: table copies differ, showing the first")
+    if table["trailer"].strip(b"\x00"):
+        safe_print(f"Trailer: {table['trailer'].hex(' ')}")
+    safe_print()
+
+    if records:
+        safe_print("=== Increment records ===")
+        safe_print(f"  {'offset':>8} {'incr':>5} {'incr2':>5} {'seq':>5}  "
+                   f"{'saved (UTC)':<19}  user")
+        for i in range(len(records["user"])):
+            seq = records["sequence"][i]
+            safe_print(
+                f"  0x{records['offset'][i]:06X} {records['increment'][i]:>5} "
+                f"{records['increment_2'][i]:>5} "
+                f"{seq if seq < 1 << 32 else '-':>5}  "
+                f"{format_timestamp(records['timestamp'][i]):<19}  "
+                f"{users[records['user'][i]] or '<none>'}"
+            )
+        safe_print()
+
+    safe_print("=== Users ===")
+    ranked = sorted(
+        zip(users, table["user_counts"]), key=lambda item: -item[1]
+    )
+    for user, count in ranked:
+        safe_print(f"  {count:>4}  {user or '<none>'}")
+    safe_print()
+    if stamps:
+        safe_print(f"First save: {format_timestamp(min(stamps))}")
+        safe_print(f"Last save:  {format_timestamp(max(stamps))}")
+        safe_print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
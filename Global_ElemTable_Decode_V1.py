@@ -2,37 +2,13 @@ import argparse
 import binascii
 import pathlib
 import struct
-import sys
 import zlib
 
-STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
-
-
-def safe_print(text: str = ""):
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(STDOUT_ENCODING, errors="backslashreplace").decode(
-            STDOUT_ENCODING, errors="backslashreplace"
-        )
-        print(safe)
-
-
-def emit_lines(lines, output_lines):
-    for line in lines:
-        safe_print(line)
-        output_lines.append(line)
-
-
-def hexdump(data: bytes, max_bytes: int = 256, width: int = 16):
-    data = data[:max_bytes]
-    lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hex_part = " ".join(f"{b:02X}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{i:08X}: {hex_part:<47}  {ascii_part}")
-    return lines
+from rfa_gzip import inflate_bounded
+from rfa_hexdump import iter_hexdump
+from rfa_ints import u32_view
+from rfa_output import emit_lines, report_writer, safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings
 
 
 def parse_gzip_header(data: bytes):
@@ -87,9 +63,8 @@ def decompress_gzip_raw(data: bytes):
     if len(data) < start + 8:
         raise ValueError("Truncated gzip stream")
     payload = data[start:]
-    obj = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
-    out = obj.decompress(payload)
-    unused = obj.unused_data
+    out, end = inflate_bounded(payload)
+    unused = payload[end:] if end is not None else b""
     trailer = b""
     extra_after_trailer = b""
     if len(unused) >= 8:
@@ -106,77 +81,14 @@ def decompress_gzip_raw(data: bytes):
     return out, unused, extra_after_trailer, header, crc32, isize
 
 
-def extract_ascii_strings(data: bytes, min_len: int = 4):
-    results = []
-    current = bytearray()
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                results.append(current.decode("ascii", errors="ignore"))
-            current = bytearray()
-    if len(current) >= min_len:
-        results.append(current.decode("ascii", errors="ignore"))
-    return results
-
-
-def extract_utf16le_strings(data: bytes, min_len: int = 4):
-    results = []
-    current = []
-    i = 0
-    while i + 1 < len(data):
-        ch = data[i]
-        nul = data[i + 1]
-        if 32 <= ch <= 126 and nul == 0:
-            current.append(chr(ch))
-        else:
-            if len(current) >= min_len:
-                results.append("".join(current))
-            current = []
-        i += 2
-    if len(current) >= min_len:
-        results.append("".join(current))
-    return results
-
-
-def format_u32_list(data: bytes):
-    values = []
-    for i in range(0, len(data) - 3, 4):
-        values.append(struct.unpack_from("<I", data, i)[0])
-    return values
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Decode Global_ElemTable.bin from an RFA unpack."
-    )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        default=r"racbasicsamplefamily\Global_ElemTable.bin",
-        help="Path to Global_ElemTable.bin",
-    )
-    args = parser.parse_args()
-
-    path = pathlib.Path(args.path)
-    if not path.exists():
-        safe_print(f"File not found: {path}")
-        return 1
-
-    blob = path.read_bytes()
-    output_lines = []
-
-    def emit(text: str = ""):
-        safe_print(text)
-        output_lines.append(text)
-
+def write_report(path: pathlib.Path, blob: bytes, emit):
+    """Emit the full report line by line; returns an error message or None."""
     emit(f"File: {path}")
     emit(f"Size: {len(blob)} bytes")
     emit()
 
     emit("File hexdump (first 256 bytes):")
-    emit_lines(hexdump(blob, max_bytes=256), output_lines)
+    emit_lines(iter_hexdump(blob, length=256), emit)
     emit()
 
     if len(blob) >= 8:
@@ -196,11 +108,7 @@ def main():
             )
         except Exception as exc:
             emit(f"Decompression failed: {exc}")
-            output_dir = pathlib.Path(__file__).resolve().parent
-            output_path = output_dir / "Global_ElemTable_V1_Readable.txt"
-            output_path.write_text("\n".join(output_lines), encoding="utf-8")
-            emit(f"Saved: {output_path}")
-            return 1
+            return f"Decompression failed: {exc}"
 
         emit("GZip header:")
         emit(f"  cm: {header['cm']}")
@@ -223,50 +131,81 @@ def main():
         emit()
 
         emit("Decompressed hexdump (first 256 bytes):")
-        emit_lines(hexdump(data, max_bytes=256), output_lines)
+        emit_lines(iter_hexdump(data, length=256), emit)
         emit()
 
-        u32_values = format_u32_list(data[:256])
+        u32_values = u32_view(data[:256])
         if u32_values:
             emit("Decompressed u32 (little-endian, first 256 bytes):")
             emit("  " + " ".join(str(v) for v in u32_values))
             emit()
 
-        utf16_strings = extract_utf16le_strings(data, min_len=4)
+        utf16_strings = utf16le_strings(data, min_len=4)
         if utf16_strings:
             emit("UTF-16LE strings:")
             for s in utf16_strings:
                 emit(f"  {s}")
             emit()
 
-        ascii_strings = extract_ascii_strings(data, min_len=4)
-        if ascii_strings:
+        ascii_found = ascii_strings(data, min_len=4)
+        if ascii_found:
             emit("ASCII strings:")
-            for s in ascii_strings:
+            for s in ascii_found:
                 emit(f"  {s}")
             emit()
 
         if unused:
             emit("Unused data after deflate stream (hex):")
-            emit_lines(hexdump(unused, max_bytes=len(unused)), output_lines)
+            emit_lines(iter_hexdump(unused), emit)
             emit()
 
         if extra_after_trailer:
             emit("Extra bytes after trailer (hex):")
             emit_lines(
-                hexdump(extra_after_trailer, max_bytes=len(extra_after_trailer)),
-                output_lines,
+                iter_hexdump(extra_after_trailer),
+                emit,
             )
             emit()
     else:
         emit("No gzip signature found.")
 
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Global_ElemTable.bin from an RFA unpack."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily\Global_ElemTable.bin",
+        help="Path to Global_ElemTable.bin",
+    )
+    parser.add_argument(
+        "--echo",
+        action="store_true",
+        help="Also print the full report to the console",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    path = pathlib.Path(args.path)
+    if not path.exists():
+        safe_print(f"File not found: {path}")
+        return 1
+
+    blob = path.read_bytes()
     output_dir = pathlib.Path(__file__).resolve().parent
     output_path = output_dir / "Global_ElemTable_V1_Readable.txt"
-    output_path.write_text("\n".join(output_lines), encoding="utf-8")
-    emit(f"Saved: {output_path}")
-
-    return 0
+    echo = safe_print if args.echo else None
+    with report_writer(output_path, echo=echo) as emit:
+        error = write_report(path, blob, emit)
+    if error and not args.echo:
+        safe_print(error)
+    safe_print(f"Saved: {output_path}")
+
+    return 1 if error else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+import argparse
+import pathlib
+import struct
+import time
+
+import numpy as np
+
+from rfa_gzip import locate_gzip
+from rfa_output import safe_print, setup_console
+
+STREAM_NAME = "Global/ElemTable"
+HEADER_SIZE = 6
+
+# Main table, 28 bytes per element. Layout as observed in the samples:
+#   element_id, element_id_2  - the element id, stored twice
+#   value_a/b/c               - small counters, mostly equal to each other
+#   reserved                  - always 0 so far
+#   ref_id                    - another element id (-1 = none); 17 for most
+ELEM_RECORD = np.dtype([
+    ("element_id", "<i4"),
+    ("element_id_2", "<i4"),
+    ("value_a", "<u4"),
+    ("value_b", "<u4"),
+    ("value_c", "<u4"),
+    ("reserved", "<u4"),
+    ("ref_id", "<i4"),
+])
+
+# Second, short table after its own u32 count, 24 bytes per element.
+EXTRA_RECORD = np.dtype([
+    ("element_id", "<i4"),
+    ("reserved", "<u4"),
+    ("element_id_2", "<i4"),
+    ("value_a", "<u4"),
+    ("value_b", "<u4"),
+    ("value_c", "<u4"),
+])
+
+# Element-id index: one row per decoded record, sorted by element_id.
+# table is 0 for the main table, 1 for the extra table; offset is the byte
+# offset of the record in the decompressed payload.
+ID_INDEX = np.dtype([
+    ("element_id", "<i4"),
+    ("table", "u1"),
+    ("row", "<u4"),
+    ("offset", "<u4"),
+])
+
+
+def read_elem_table_stream(path: pathlib.Path):
+    """Raw Global/ElemTable bytes from a dumped .bin or an .rfa/.rvt."""
+    if path.suffix.lower() in (".rfa", ".rvt", ".rte", ".rft"):
+        import olefile
+
+        with olefile.OleFileIO(str(path)) as ole:
+            if not ole.exists(STREAM_NAME):
+                raise ValueError(f"No {STREAM_NAME} stream")
+            return ole.openstream(STREAM_NAME).read()
+    return path.read_bytes()
+
+
+def decompress_elem_table(blob: bytes):
+    member = locate_gzip(blob, verify=False)
+    if member is None:
+        raise ValueError("No gzip member in Global/ElemTable")
+    return member["data"]
+
+
+def parse_elem_table(data: bytes):
+    """
+    Map the decompressed ElemTable onto structured arrays without copying:
+    {"header": u16, "count": u32, "records": ELEM_RECORD array,
+     "extra_records": EXTRA_RECORD array, "trailer": bytes}.
+    The arrays are read-only views into data.
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("ElemTable payload too short")
+    header, count = struct.unpack_from("<HI", data, 0)
+    end = HEADER_SIZE + count * ELEM_RECORD.itemsize
+    if end > len(data):
+        raise ValueError(
+            f"ElemTable claims {count} records, payload holds "
+            f"{(len(data) - HEADER_SIZE) // ELEM_RECORD.itemsize}"
+        )
+    records = np.frombuffer(data, dtype=ELEM_RECORD, count=count, offset=HEADER_SIZE)
+
+    extra = np.empty(0, dtype=EXTRA_RECORD)
+    pos = end
+    if pos + 4 <= len(data):
+        extra_count = struct.unpack_from("<I", data, pos)[0]
+        extra_end = pos + 4 + extra_count * EXTRA_RECORD.itemsize
+        if extra_end <= len(data):
+            extra = np.frombuffer(
+                data, dtype=EXTRA_RECORD, count=extra_count, offset=pos + 4
+            )
+            pos = extra_end
+
+    return {
+        "header": header,
+        "count": count,
+        "records": records,
+        "extra_records": extra,
+        "trailer": data[pos:],
+    }
+
+
+def summarize_elem_table(table: dict):
+    """Counts and id ranges, computed column-wise."""
+    records = table["records"]
+    ids = records["element_id"]
+    live = ids[ids > 0]
+    summary = {
+        "elements": int(live.size),
+        "min_id": int(live.min()) if live.size else None,
+        "max_id": int(live.max()) if live.size else None,
+        "unique_ids": int(np.unique(live).size),
+        "id_mismatch": int(np.count_nonzero(ids != records["element_id_2"])),
+        "extra_elements": int(table["extra_records"].size),
+    }
+    refs, ref_counts = np.unique(records["ref_id"], return_counts=True)
+    order = np.argsort(ref_counts)[::-1][:5]
+    summary["top_ref_ids"] = [
+        (int(refs[i]), int(ref_counts[i])) for i in order
+    ]
+    return summary
+
+
+def build_id_index(table: dict):
+    """Sorted ID_INDEX array over both record tables."""
+    records = table["records"]
+    extra = table["extra_records"]
+    index = np.empty(records.size + extra.size, dtype=ID_INDEX)
+    n = records.size
+    index["element_id"][:n] = records["element_id"]
+    index["table"][:n] = 0
+    index["row"][:n] = np.arange(n)
+    index["offset"][:n] = HEADER_SIZE + np.arange(n) * ELEM_RECORD.itemsize
+    extra_base = HEADER_SIZE + n * ELEM_RECORD.itemsize + 4
+    index["element_id"][n:] = extra["element_id"]
+    index["table"][n:] = 1
+    index["row"][n:] = np.arange(extra.size)
+    index["offset"][n:] = extra_base + np.arange(extra.size) * EXTRA_RECORD.itemsize
+    return index[np.argsort(index["element_id"], kind="stable")]
+
+
+def save_id_index(index, path: pathlib.Path):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, index)
+    tmp.replace(path)
+
+
+def load_id_index(path: pathlib.Path):
+    """Memory-map a saved index; nothing is read until it is queried."""
+    return np.load(path, mmap_mode="r")
+
+
+def lookup_element(index, element_id: int):
+    """Binary search the sorted index; every entry for element_id, as dicts."""
+    ids = index["element_id"]
+    lo = int(np.searchsorted(ids, element_id, side="left"))
+    hi = int(np.searchsorted(ids, element_id, side="right"))
+    return [
+        {
+            "element_id": int(entry["element_id"]),
+            "table": "extra" if entry["table"] else "main",
+            "row": int(entry["row"]),
+            "offset": int(entry["offset"]),
+        }
+        for entry in index[lo:hi]
+    ]
+
+
+def index_path_for(path: pathlib.Path):
+    return path.with_name(path.stem + "_ids.npy")
+
+
+def get_id_index(path: pathlib.Path, persist: bool):
+    """
+    Index for one input. A saved index next to the input is memory-mapped
+    when it is newer than the input; otherwise the index is rebuilt, and
+    with persist also saved. Returns (index, loaded_from_disk).
+    """
+    idx_path = index_path_for(path)
+    if idx_path.exists() and idx_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        return load_id_index(idx_path), True
+    table = parse_elem_table(decompress_elem_table(read_elem_table_stream(path)))
+    index = build_id_index(table)
+    if persist:
+        save_id_index(index, idx_path)
+    return index, False
+
+
+def print_records(records, limit: int):
+    names = records.dtype.names
+    safe_print("  " + " ".join(f"{n:>12}" for n in names))
+    for row in records[:limit].tolist():
+        safe_print("  " + " ".join(f"{v:>12}" for v in row))
+
+
+def run_lookups(args):
+    found_any = False
+    for raw_path in args.paths:
+        path = pathlib.Path(raw_path)
+        if not path.exists():
+            safe_print(f"File not found: {path}")
+            continue
+        start = time.perf_counter()
+        try:
+            index, loaded = get_id_index(path, args.index)
+        except Exception as exc:
+            safe_print(f"{path}: {exc}")
+            continue
+        ready_ms = (time.perf_counter() - start) * 1000
+        safe_print(f"File: {path}")
+        safe_print(f"Index: {index.size} ids, "
+                   f"{'memory-mapped' if loaded else 'built'} in {ready_ms:.2f} ms")
+        for element_id in args.lookup:
+            start = time.perf_counter()
+            hits = lookup_element(index, element_id)
+            query_us = (time.perf_counter() - start) * 1e6
+            if not hits:
+                safe_print(f"  {element_id}: not found ({query_us:.1f} us)")
+            for hit in hits:
+                found_any = True
+                safe_print(
+                    f"  {element_id}: {hit['table']} table row {hit['row']}, "
+                    f"payload offset 0x{hit['offset']:06X} ({query_us:.1f} us)"
+                )
+        safe_print()
+    return 0 if found_any else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode Global_ElemTable records into NumPy columns "
+                    "(one or many dumped .bin or .rfa files)."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[r"racbasicsamplefamily/Global_ElemTable.bin"],
+        help="Global_ElemTable.bin dumps or .rfa/.rvt files",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=20,
+        help="Records to print per file (default: 20, 0 = none)",
+    )
+    parser.add_argument(
+        "--csv",
+        help="Write all main-table records of all files to this CSV",
+    )
+    parser.add_argument(
+        "--lookup",
+        type=int,
+        action="append",
+        metavar="ID",
+        help="Find the record of this element id (repeatable)",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Save the id index as <name>_ids.npy next to each input; an "
+             "up-to-date saved index is memory-mapped on every lookup",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    if args.lookup:
+        return run_lookups(args)
+
+    tables = []
+    failed = 0
+    for raw_path in args.paths:
+        path = pathlib.Path(raw_path)
+        if not path.exists():
+            safe_print(f"File not found: {path}")
+            failed += 1
+            continue
+        try:
+            data = decompress_elem_table(read_elem_table_stream(path))
+            table = parse_elem_table(data)
+        except Exception as exc:
+            safe_print(f"{path}: {exc}")
+            failed += 1
+            continue
+        tables.append((path, table))
+        if args.index:
+            save_id_index(build_id_index(table), index_path_for(path))
+
+        summary = summarize_elem_table(table)
+        safe_print(f"File: {path}")
+        safe_print(f"Decompressed size: {len(data)} bytes")
+        safe_print(f"Header u16: {table['header']}")
+        safe_print(f"Records: {table['count']} x {ELEM_RECORD.itemsize} bytes")
+        safe_print(f"Elements: {summary['elements']} "
+                   f"(ids {summary['min_id']}..{summary['max_id']}, "
+                   f"{summary['unique_ids']} unique)")
+        if summary["id_mismatch"]:
+            safe_print(f"Records with differing id copies: {summary['id_mismatch']}")
+        safe_print(f"Extra records: {summary['extra_elements']} "
+                   f"x {EXTRA_RECORD.itemsize} bytes")
+        safe_print("Most common ref_id: " + ", ".join(
+            f"{ref} ({n})" for ref, n in summary["top_ref_ids"]
+        ))
+        safe_print(f"Trailer: {table['trailer'].hex(' ')}")
+        if args.rows:
+            safe_print()
+            safe_print(f"First {args.rows} records:")
+            print_records(table["records"], args.rows)
+            if table["extra_records"].size:
+                safe_print()
+                safe_print("Extra records:")
+                print_records(table["extra_records"], args.rows)
+        safe_print()
+
+    if len(tables) > 1:
+        counts = np.array([t["count"] for _, t in tables])
+        max_ids = np.array([
+            t["records"]["element_id"].max() if t["count"] else 0
+            for _, t in tables
+        ])
+        safe_print(f"Files: {len(tables)} ok, {failed} failed")
+        safe_print(f"Records: {int(counts.sum())} total, "
+                   f"{counts.mean():.1f} mean, {int(counts.max())} max")
+        safe_print(f"Highest element id: {int(max_ids.max())}")
+
+    if args.csv and tables:
+        all_records = np.concatenate([t["records"] for _, t in tables])
+        sources = np.repeat(
+            np.arange(len(tables)), [t["count"] for _, t in tables]
+        )
+        with open(args.csv, "w", encoding="utf-8", newline="") as fh:
+            fh.write("source," + ",".join(ELEM_RECORD.names) + "\n")
+            for src, row in zip(sources.tolist(), all_records.tolist()):
+                fh.write(f"{tables[src][0]}," + ",".join(map(str, row)) + "\n")
+        safe_print(f"CSV written: {args.csv}")
+
+    return 0 if tables else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+import argparse
+import contextlib
+import pathlib
+
+from rfa_gzip import DEFAULT_MAX_BUFFER, DEFAULT_READ_SIZE, iter_inflate
+from rfa_output import safe_print, setup_console
+from rfa_strings import iter_ascii_strings_chunked
+
+
+def open_stream(args, stack: contextlib.ExitStack):
+    """
+    Open either a dumped .bin or a stream inside an .rfa/.rvt. Everything
+    opened is registered with stack, so it is closed even if a later step
+    fails.
+    """
+    if args.rfa:
+        import olefile
+
+        from rfa_olestream import open_lazy_stream
+
+        ole = stack.enter_context(olefile.OleFileIO(args.rfa))
+        # sectors are read as the inflater asks for them, not up front
+        return stack.enter_context(open_lazy_stream(ole, args.stream))
+    return stack.enter_context(open(args.path, "rb"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stream-decode a Partitions/NN stream with bounded memory."
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=r"racbasicsamplefamily/Partitions_63.bin",
+        help="Path to a dumped Partitions_NN.bin "
+             "(default: racbasicsamplefamily/Partitions_63.bin)",
+    )
+    parser.add_argument(
+        "--rfa",
+        help="Read the stream straight from this .rfa/.rvt instead of a .bin",
+    )
+    parser.add_argument(
+        "--stream",
+        default="Partitions/63",
+        help="Stream name inside --rfa (default: Partitions/63)",
+    )
+    parser.add_argument(
+        "--read-size",
+        type=int,
+        default=DEFAULT_READ_SIZE,
+        help=f"Compressed bytes read per step (default: {DEFAULT_READ_SIZE})",
+    )
+    parser.add_argument(
+        "--max-buffer",
+        type=int,
+        default=DEFAULT_MAX_BUFFER,
+        help=f"Max decompressed bytes held at once (default: {DEFAULT_MAX_BUFFER})",
+    )
+    parser.add_argument(
+        "--min-len",
+        type=int,
+        default=6,
+        help="Minimum ASCII string length (default: 6)",
+    )
+    parser.add_argument(
+        "--max-strings",
+        type=int,
+        default=100,
+        help="Stop printing strings after this many (default: 100)",
+    )
+    parser.add_argument(
+        "--out",
+        help="Write the decompressed data (all members concatenated) here",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    source = args.rfa or args.path
+    if not pathlib.Path(source).exists():
+        safe_print(f"File not found: {source}")
+        return 1
+
+    members = []
+    shown = 0
+    total_strings = 0
+    with contextlib.ExitStack() as stack:
+        fh = open_stream(args, stack)
+        out_fh = stack.enter_context(open(args.out, "wb")) if args.out else None
+
+        def chunks():
+            for _, chunk in iter_inflate(
+                fh,
+                read_size=args.read_size,
+                max_buffer=args.max_buffer,
+                members=members,
+            ):
+                if out_fh is not None:
+                    out_fh.write(chunk)
+                yield chunk
+
+        safe_print(f"File: {source}")
+        if args.rfa:
+            safe_print(f"Stream: {args.stream}")
+        safe_print()
+
+        safe_print(
+            f"=== ASCII strings (min {args.min_len}, first {args.max_strings}) ==="
+        )
+        for off, s in iter_ascii_strings_chunked(chunks(), min_len=args.min_len):
+            total_strings += 1
+            if shown < args.max_strings:
+                safe_print(f"  0x{off:08X}: {s}")
+                shown += 1
+    safe_print(f"  ({total_strings} strings total)")
+    safe_print()
+
+    safe_print("=== Gzip members ===")
+    total = 0
+    for i, m in enumerate(members):
+        total += m["size"]
+        if m["status"] == "ok":
+            crc = "ok" if m["crc_ok"] and m["size_ok"] else "MISMATCH"
+            safe_print(
+                f"  [{i}] 0x{m['start']:08X}-0x{m['end']:08X} "
+                f"compressed {m['compressed_size']} -> {m['size']} bytes, crc {crc}"
+            )
+        else:
+            status = f"{m['status']} ({m['limit']})" if m["limit"] else m["status"]
+            safe_print(
+                f"  [{i}] 0x{m['start']:08X} {status} "
+                f"after {m['size']} decompressed bytes"
+            )
+    safe_print(f"  total decompressed: {total} bytes")
+    if args.out:
+        safe_print(f"Decompressed data saved as: {args.out}")
+    safe_print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
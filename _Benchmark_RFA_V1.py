@@ -0,0 +1,269 @@
+import argparse
+import io
+import pathlib
+import struct
+import sys
+import time
+import zlib
+
+from Global_ContentDocuments_Decode_V3 import scan_for_streams
+from rfa_gzip import iter_gzip_members
+from rfa_hexdump import iter_hexdump
+from rfa_ints import u16_view, u32_view
+from rfa_output import flush_console, safe_print, setup_console
+from rfa_strings import ascii_strings, utf16le_strings_all_alignments
+
+# ---------------------------------------------------------------------------
+# Legacy reference implementations (as they were in the decoders)
+# ---------------------------------------------------------------------------
+
+def legacy_utf16le_strings_all_alignments(blob: bytes, min_len: int = 4):
+    results = []
+
+    for start in (0, 1):
+        cur = []
+
+        def flush():
+            nonlocal cur
+            if len(cur) >= min_len:
+                results.append("".join(cur))
+            cur = []
+
+        i = start
+        while i + 1 < len(blob):
+            ch = blob[i]
+            nul = blob[i + 1]
+            if 32 <= ch <= 126 and nul == 0:
+                cur.append(chr(ch))
+            else:
+                flush()
+            i += 2
+        flush()
+
+    uniq = []
+    seen = set()
+    for s in results:
+        if s not in seen:
+            uniq.append(s)
+            seen.add(s)
+    return uniq
+
+
+def legacy_ascii_strings_from_bytes(blob: bytes, min_len: int = 4):
+    results = []
+    current = bytearray()
+
+    def flush():
+        nonlocal current
+        if len(current) >= min_len:
+            results.append(current.decode("ascii", errors="ignore"))
+        current = bytearray()
+
+    for b in blob:
+        if 32 <= b <= 126:
+            current.append(b)
+        else:
+            flush()
+    flush()
+    return results
+
+
+def legacy_safe_print(text: str = ""):
+    try:
+        print(text)
+    except UnicodeEncodeError:
+        safe = text.encode("utf-8", errors="backslashreplace").decode(
+            "utf-8", errors="backslashreplace"
+        )
+        print(safe)
+
+
+def legacy_format_u16_list(data: bytes):
+    values = []
+    for i in range(0, len(data) - 1, 2):
+        values.append(struct.unpack_from("<H", data, i)[0])
+    return values
+
+
+def legacy_format_u32_list(data: bytes):
+    values = []
+    for i in range(0, len(data) - 3, 4):
+        values.append(struct.unpack_from("<I", data, i)[0])
+    return values
+
+
+def legacy_hexdump(data: bytes, width: int = 16):
+    lines = []
+    for i in range(0, len(data), width):
+        chunk = data[i : i + width]
+        hex_part = " ".join(f"{b:02X}" for b in chunk)
+        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+        lines.append(f"{i:08X}: {hex_part:<47}  {ascii_part}")
+    return lines
+
+
+def legacy_scan_for_streams(data: bytes, min_out_len: int = 4):
+    hits = []
+    for i in range(0, len(data)):
+        chunk = data[i:]
+        for label, wbits in [
+            ("zlib", zlib.MAX_WBITS),
+            ("raw", -zlib.MAX_WBITS),
+            ("gzip", 16 + zlib.MAX_WBITS),
+        ]:
+            try:
+                out = zlib.decompress(chunk, wbits=wbits)
+                if len(out) >= min_out_len:
+                    hits.append((i, label, out))
+            except Exception:
+                pass
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def timed(func, *args, repeat: int = 3, **kwargs):
+    """Best-of-repeat wall time in seconds, plus the last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def report(name: str, old_s: float, new_s: float, same: bool):
+    speedup = old_s / new_s if new_s > 0 else float("inf")
+    safe_print(
+        f"  {name:<28} legacy {old_s * 1000:9.1f} ms   "
+        f"new {new_s * 1000:8.2f} ms   {speedup:7.1f}x   "
+        f"{'same output' if same else 'OUTPUT DIFFERS'}"
+    )
+
+
+def bench_utf16_strings(data: bytes):
+    old_s, old = timed(legacy_utf16le_strings_all_alignments, data, 4, repeat=1)
+    new_s, new = timed(utf16le_strings_all_alignments, data, 4)
+    report("utf16le all alignments", old_s, new_s, old == new)
+
+
+def bench_ascii_strings(data: bytes):
+    old_s, old = timed(legacy_ascii_strings_from_bytes, data, 4, repeat=1)
+    new_s, new = timed(ascii_strings, data, 4)
+    report("ascii strings", old_s, new_s, old == new)
+
+
+def _print_lines(printer, lines):
+    """Run printer over lines with stdout captured; returns the text."""
+    flush_console()
+    saved = sys.stdout
+    sys.stdout = io.StringIO()
+    setup_console()
+    try:
+        for line in lines:
+            printer(line)
+        flush_console()
+        return sys.stdout.getvalue()
+    finally:
+        sys.stdout = saved
+        setup_console()
+
+
+def bench_console(data: bytes):
+    lines = [data[i : i + 16].hex(" ") for i in range(0, len(data), 16)]
+    old_s, old = timed(_print_lines, legacy_safe_print, lines, repeat=1)
+    new_s, new = timed(_print_lines, safe_print, lines)
+    report("console lines", old_s, new_s, old == new)
+
+
+def bench_hexdump(data: bytes):
+    old_s, old = timed(legacy_hexdump, data, repeat=1)
+    new_s, new = timed(lambda d: list(iter_hexdump(d)), data)
+    report("hexdump", old_s, new_s, old == new)
+
+
+def bench_ints(data: bytes):
+    old_s, old = timed(legacy_format_u16_list, data, repeat=1)
+    new_s, new = timed(lambda d: u16_view(d).tolist(), data)
+    report("u16 list", old_s, new_s, old == new)
+    # odd offset: unaligned view
+    old_s, old = timed(legacy_format_u32_list, data[1:], repeat=1)
+    new_s, new = timed(lambda d: u32_view(d, 1).tolist(), data)
+    report("u32 list (offset 1)", old_s, new_s, old == new)
+
+
+# the legacy scan is quadratic; it is only run on this much of the corpus
+SCAN_BYTES = 128 << 10
+
+
+def bench_scan(data: bytes):
+    data = data[:SCAN_BYTES]
+    old_s, old = timed(legacy_scan_for_streams, data, repeat=1)
+    new_s, new = timed(scan_for_streams, data)
+    report(f"stream scan ({len(data) >> 10} KiB)", old_s, new_s, old == new)
+
+
+BENCHMARKS = {
+    "ascii": bench_ascii_strings,
+    "console": bench_console,
+    "hexdump": bench_hexdump,
+    "ints": bench_ints,
+    "scan": bench_scan,
+    "utf16": bench_utf16_strings,
+}
+
+
+def load_corpus(sample_dir: pathlib.Path, size_mb: float):
+    """Decompressed Formats_Latest + Partitions data, repeated to size_mb."""
+    parts = []
+    for name in ("Formats_Latest.bin", "Partitions_63.bin"):
+        path = sample_dir / name
+        if path.exists():
+            # the sample Formats_Latest trailer CRC does not match; use it anyway
+            members = iter_gzip_members(path.read_bytes(), verify=False)
+            parts.extend(m["data"] for m in members)
+    if not parts:
+        raise FileNotFoundError(f"No sample streams found in {sample_dir}")
+    base = b"".join(parts)
+    target = int(size_mb * 1024 * 1024)
+    reps = max(1, target // len(base))
+    return base * reps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the shared helpers against the legacy decoder code."
+    )
+    parser.add_argument(
+        "--sample-dir",
+        default="racbasicsamplefamily",
+        help="Folder with dumped streams (default: racbasicsamplefamily)",
+    )
+    parser.add_argument(
+        "--size-mb",
+        type=float,
+        default=4.0,
+        help="Approximate corpus size in MB (default: 4)",
+    )
+    parser.add_argument(
+        "--only",
+        choices=sorted(BENCHMARKS),
+        action="append",
+        help="Run only these benchmarks (repeatable)",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    data = load_corpus(pathlib.Path(args.sample_dir), args.size_mb)
+    safe_print(f"Corpus: {len(data)} bytes")
+    for name in args.only or BENCHMARKS:
+        BENCHMARKS[name](data)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
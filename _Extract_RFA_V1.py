@@ -1,70 +1,11 @@
 import sys
 from pathlib import Path
-import locale
 
 import olefile
 
-STDOUT_ENCODING = sys.stdout.encoding or locale.getpreferredencoding(False)
-
-
-def safe_print(text: str = ""):
-    """Print text without UnicodeEncodeError."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING,
-            errors="replace"
-        ).decode(
-            STDOUT_ENCODING,
-            errors="replace"
-        )
-        print(safe)
-
-
-def hexdump(data: bytes, max_bytes: int = 64):
-    """Make a simple hexdump of the first max_bytes."""
-    data = data[:max_bytes]
-    hex_parts = []
-    ascii_parts = []
-
-    for i, b in enumerate(data):
-        hex_parts.append(f"{b:02X}")
-        ascii_parts.append(chr(b) if 32 <= b < 127 else ".")
-
-        # blocks of 16 bytes
-        if (i + 1) % 16 == 0:
-            yield "{:<48}  {}".format(" ".join(hex_parts), "".join(ascii_parts))
-            hex_parts = []
-            ascii_parts = []
-
-    if hex_parts:
-        yield "{:<48}  {}".format(" ".join(hex_parts), "".join(ascii_parts))
-
-
-def extract_ascii_strings(data: bytes, min_len: int = 4):
-    """Search for readable ASCII strings in the data."""
-    result = []
-    current = bytearray()
-
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                try:
-                    result.append(current.decode("ascii", errors="ignore"))
-                except Exception:
-                    pass
-            current = bytearray()
-
-    if len(current) >= min_len:
-        try:
-            result.append(current.decode("ascii", errors="ignore"))
-        except Exception:
-            pass
-
-    return result
+from rfa_hexdump import iter_hexdump
+from rfa_output import safe_print, setup_console
+from rfa_strings import ascii_strings
 
 
 def parse_basic_file_info(data: bytes):
@@ -113,7 +54,7 @@ def inspect_rfa(path: Path):
             safe_print(f"Size: {size} bytes")
 
             safe_print("\nHexdump (first 64 bytes):")
-            for line in hexdump(data, max_bytes=64):
+            for line in iter_hexdump(data, length=64, offset_format="", pad=48):
                 safe_print(line)
 
             # special handling for BasicFileInfo
@@ -129,7 +70,7 @@ def inspect_rfa(path: Path):
                 )
 
             # extract strings for all streams
-            strings_found = extract_ascii_strings(data, min_len=4)
+            strings_found = ascii_strings(data, min_len=4)
             if strings_found:
                 safe_print("\nASCII strings (selection):")
                 for s in strings_found[:20]:
@@ -155,6 +96,7 @@ def inspect_rfa(path: Path):
 
 
 if __name__ == "__main__":
+    setup_console()
     if len(sys.argv) > 1:
         rfa_path = Path(sys.argv[1])
     else:
@@ -1,70 +1,30 @@
-import sys
+import argparse
+import glob
+import json
+import os
+import time
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-import locale
 
 import olefile
 
-STDOUT_ENCODING = sys.stdout.encoding or locale.getpreferredencoding(False)
+from BasicFileInfo_Decode_V6 import decode_basic_file_info
+from rfa_decoders import decode_stream, find_decoder
+from rfa_gzip import DEFAULT_MAX_OUTPUT, DEFAULT_TIME_BUDGET, set_limits
+from rfa_hexdump import iter_hexdump
+from rfa_olestream import mapped_olefile, open_lazy_stream
+from rfa_output import flush_console, safe_print, setup_console
+from rfa_state import (
+    file_identity, is_unchanged, load_state, make_entry, save_state, state_key,
+)
+from rfa_store import store_blob, write_manifest
+from rfa_strings import ascii_strings, iter_ascii_strings_chunked
 
-
-def safe_print(text: str = ""):
-    """Print text without UnicodeEncodeError."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe = text.encode(
-            STDOUT_ENCODING,
-            errors="replace"
-        ).decode(
-            STDOUT_ENCODING,
-            errors="replace"
-        )
-        print(safe)
-
-
-def hexdump(data: bytes, max_bytes: int = 64):
-    """Make a simple hexdump of the first max_bytes."""
-    data = data[:max_bytes]
-    hex_parts = []
-    ascii_parts = []
-
-    for i, b in enumerate(data):
-        hex_parts.append(f"{b:02X}")
-        ascii_parts.append(chr(b) if 32 <= b < 127 else ".")
-
-        # blocks of 16 bytes
-        if (i + 1) % 16 == 0:
-            yield "{:<48}  {}".format(" ".join(hex_parts), "".join(ascii_parts))
-            hex_parts = []
-            ascii_parts = []
-
-    if hex_parts:
-        yield "{:<48}  {}".format(" ".join(hex_parts), "".join(ascii_parts))
-
-
-def extract_ascii_strings(data: bytes, min_len: int = 4):
-    """Search for readable ASCII strings in the data."""
-    result = []
-    current = bytearray()
-
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-        else:
-            if len(current) >= min_len:
-                try:
-                    result.append(current.decode("ascii", errors="ignore"))
-                except Exception:
-                    pass
-            current = bytearray()
-
-    if len(current) >= min_len:
-        try:
-            result.append(current.decode("ascii", errors="ignore"))
-        except Exception:
-            pass
-
-    return result
+HEADER_BYTES = 64
+DECODED_NAME = "decoded.json"
 
 
 def parse_basic_file_info(data: bytes):
@@ -84,19 +44,62 @@ def parse_basic_file_info(data: bytes):
     return lines
 
 
-def inspect_rfa(path: Path):
+def _silent(text: str = ""):
+    pass
+
+
+def inspect_rfa(
+    path: Path,
+    verbose: bool = True,
+    store_dir: Path | None = None,
+    headers_only: bool = False,
+    mapped: bool = False,
+    decode: bool = False,
+    dump: bool = True,
+):
+    """
+    Dump every stream of one .rfa to <report_dir>/<stream>.bin.
+
+    With store_dir, streams go to a content-addressed store instead
+    (identical streams are written once) and <report_dir>/manifest.json
+    maps stream names to their hashes.
+    With headers_only nothing is written: streams are opened lazily and
+    only the sectors needed for the header hexdump and the string
+    selection are read.
+    With mapped, the file is mmap'ed and each stream is handled as a
+    memoryview into the mapping (no copy when its sectors are contiguous).
+    With decode, streams that have a decoder in rfa_decoders.DECODERS are
+    decoded in memory from the same read and their summaries are written
+    to <report_dir>/decoded.json; dump=False (or headers_only) skips
+    writing, including the decoders' caches (formats_cache/).
+    Returns a small summary dict (stream count, total bytes, decoded
+    stream summaries).
+    """
     if not path.exists():
-        safe_print(f"File not found: {path}")
-        sys.exit(1)
+        raise FileNotFoundError(f"File not found: {path}")
 
-    report_dir = path.with_suffix("")  # e.g. racbasicsamplefamily
-    report_dir.mkdir(exist_ok=True)
+    out = safe_print if verbose else _silent
 
-    safe_print(f"File: {path}")
-    safe_print(f"Report folder: {report_dir}")
-    safe_print()
+    dump = dump and not headers_only
+    report_dir = path.with_suffix("")  # e.g. racbasicsamplefamily
 
-    with olefile.OleFileIO(str(path)) as ole:
+    out(f"File: {path}")
+    if dump:
+        out(f"Report folder: {report_dir}")
+    out()
+
+    stream_count = 0
+    total_bytes = 0
+    manifest = {}
+    blobs_written = 0
+    bytes_written = 0
+    decoded = {}
+
+    opener = mapped_olefile(path) if mapped else olefile.OleFileIO(str(path))
+    with opener as ole:
+        # only now: a file that is not a compound file leaves no empty folder
+        if dump:
+            report_dir.mkdir(exist_ok=True)
         streams = ole.listdir(streams=True, storages=False)
 
         for stream in streams:
@@ -105,46 +108,593 @@ def inspect_rfa(path: Path):
             # For files on disk, without subfolders
             file_stub = "_".join(stream)
 
-            data = ole.openstream(stream).read()
-            size = len(data)
+            reader = open_lazy_stream(ole, stream)
+            size = reader.size
+            head = reader.read(HEADER_BYTES)
+            decoder = find_decoder(display_name) if decode else None
+            data = None
+            if not headers_only or decoder or display_name == "BasicFileInfo":
+                data = reader.view() if mapped else head + reader.read()
+            stream_count += 1
+            total_bytes += size
 
-            safe_print("=" * 80)
-            safe_print(f"STREAM: {display_name}")
-            safe_print(f"Size: {size} bytes")
+            out("=" * 80)
+            out(f"STREAM: {display_name}")
+            out(f"Size: {size} bytes")
 
-            safe_print("\nHexdump (first 64 bytes):")
-            for line in hexdump(data, max_bytes=64):
-                safe_print(line)
+            out(f"\nHexdump (first {HEADER_BYTES} bytes):")
+            for line in iter_hexdump(head, offset_format="", pad=48):
+                out(line)
 
             # special handling for BasicFileInfo
             if display_name == "BasicFileInfo":
-                safe_print("\nBasicFileInfo (attempted decode):")
-                lines = parse_basic_file_info(data)
+                out("\nBasicFileInfo (attempted decode):")
+                lines = parse_basic_file_info(bytes(data))
                 for l in lines:
-                    safe_print("  " + l)
+                    out("  " + l)
 
             # extract strings for all streams (print only)
-            strings_found = extract_ascii_strings(data, min_len=4)
-            if strings_found:
-                safe_print("\nASCII strings (selection):")
-                for s in strings_found[:20]:
-                    safe_print("  " + s)
+            if verbose:
+                if data is not None:
+                    strings_found = ascii_strings(data, min_len=4, limit=20)
+                else:
+                    # read further chunks only until 20 strings are found
+                    chunks = chain([head], reader.iter_chunks())
+                    strings_found = [
+                        s for _, s in islice(
+                            iter_ascii_strings_chunked(chunks, min_len=4), 20
+                        )
+                    ]
+                if strings_found:
+                    out("\nASCII strings (selection):")
+                    for s in strings_found:
+                        out("  " + s)
+
+            if decoder is not None:
+                if verbose:
+                    # a slow decoder should not hold back what is printed so far
+                    flush_console()
+                result = decoded[display_name] = decode_stream(
+                    display_name, data, cache=dump
+                )
+                out("\nDecoded:")
+                if result["status"] == "ok":
+                    for key, value in result["summary"].items():
+                        out(f"  {key}: {value}")
+                else:
+                    out(f"  {result['status']}: {result['error']}")
 
             # write raw data for possible further analysis
-            raw_file = report_dir / f"{file_stub}.bin"
-            raw_file.write_bytes(data)
+            if store_dir is not None and dump:
+                digest, written = store_blob(store_dir, data)
+                manifest[display_name] = {"sha256": digest, "size": size}
+                if written:
+                    blobs_written += 1
+                    bytes_written += size
+            elif dump:
+                raw_file = report_dir / f"{file_stub}.bin"
+                raw_file.write_bytes(data)
+                blobs_written += 1
+                bytes_written += size
+
+            out()
+
+    if dump and decode:
+        decoded_path = report_dir / DECODED_NAME
+        decoded_path.write_text(
+            json.dumps({"source": str(path), "streams": decoded}, indent=2),
+            encoding="utf-8",
+        )
+
+    out("=" * 80)
+    if not dump:
+        out(f"Done. {stream_count} streams, {total_bytes} bytes, nothing written.")
+    elif store_dir is not None:
+        manifest_path = write_manifest(report_dir, path, manifest)
+        out(f"Done. {blobs_written} new blobs in {store_dir}, manifest:")
+        out(str(manifest_path))
+    else:
+        out("Done. For each stream there is a .bin in:")
+        out(str(report_dir))
+    if dump and decode:
+        out(f"Decoder summaries: {decoded_path}")
+
+    return {
+        "path": str(path),
+        "report_dir": str(report_dir) if dump else None,
+        "streams": stream_count,
+        "bytes": total_bytes,
+        "blobs_written": blobs_written,
+        "bytes_written": bytes_written,
+        "decoded": decoded,
+    }
+
+
+def read_basic_file_info(path: Path, ole=None):
+    """
+    Metadata-only fast path: open the compound file (or use ole, when the
+    caller already has it open), read just the BasicFileInfo stream and
+    decode it in-process. Nothing is written.
+    """
+    if ole is None:
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        with olefile.OleFileIO(str(path)) as ole:
+            return read_basic_file_info(path, ole)
+
+    if not ole.exists("BasicFileInfo"):
+        raise ValueError("No BasicFileInfo stream")
+    data = ole.openstream("BasicFileInfo").read()
+
+    meta, _, _, _ = decode_basic_file_info(data)
+    return meta
 
-            safe_print()
+
+def collect_rfa_paths(inputs):
+    """
+    Expand directories (recursive *.rfa), glob patterns and @list files
+    (one path per line) into a sorted, de-duplicated list of paths.
+    """
+    found = []
+    for item in inputs:
+        if item.startswith("@"):
+            list_file = Path(item[1:])
+            for line in list_file.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    found.append(Path(line))
+        elif glob.has_magic(item):
+            found.extend(Path(p) for p in glob.glob(item, recursive=True))
+        elif Path(item).is_dir():
+            found.extend(
+                p for p in Path(item).rglob("*")
+                if p.suffix.lower() == ".rfa" and p.is_file()
+            )
+        else:
+            found.append(Path(item))
+
+    seen = set()
+    paths = []
+    for p in sorted(found):
+        key = str(p)
+        if key not in seen:
+            seen.add(key)
+            paths.append(p)
+    return paths
+
+
+def _inspect_worker(
+    path_str: str,
+    store_dir: str | None = None,
+    limits: dict | None = None,
+    use_hash: bool = False,
+    **options,
+):
+    """
+    Run inspect_rfa quietly; never raise, so one bad file can't stop a batch.
+    limits (max_output, time_budget) are applied with rfa_gzip.set_limits,
+    as spawned workers don't inherit them; options (mapped, decode, dump)
+    are passed on to inspect_rfa. The file's size/mtime (and sha256, with
+    use_hash) are taken first and returned as "identity" for the state.
+    """
+    if limits is not None:
+        set_limits(**limits)
+    start = time.perf_counter()
+    try:
+        identity = file_identity(Path(path_str), use_hash)
+        result = inspect_rfa(
+            Path(path_str),
+            verbose=False,
+            store_dir=Path(store_dir) if store_dir else None,
+            **options,
+        )
+        result["identity"] = identity
+        result["status"] = "ok"
+    except Exception as exc:
+        result = {
+            "path": path_str,
+            "status": "error",
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _metadata_worker(path_str: str):
+    """Run read_basic_file_info; errors become a status instead of raising."""
+    try:
+        return {
+            "path": path_str,
+            "status": "ok",
+            "metadata": read_basic_file_info(Path(path_str)),
+        }
+    except Exception as exc:
+        return {
+            "path": path_str,
+            "status": "error",
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+
+
+def _error_result(path_str: str, exc: Exception):
+    return {
+        "path": path_str,
+        "status": "error",
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def _run_isolated(worker, path_str: str):
+    """Run worker for one file in a process of its own; a crash is an error."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(worker, path_str).result()
+        except Exception as exc:
+            return _error_result(path_str, exc)
+
+
+def inspect_batch(paths, workers: int | None = None, worker=_inspect_worker):
+    """
+    Run worker (default: a quiet inspect_rfa) for many .rfa files over a
+    process pool. Yields one result dict per file (in input order).
+    A worker process that dies (crash, out of memory) breaks the pool:
+    the file it was waiting on is rerun alone, recorded as failed if it
+    breaks that process too, and the rest continue in a fresh pool.
+    """
+    path_strs = [str(p) for p in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(path_strs) or 1))
+
+    if workers == 1:
+        for p in path_strs:
+            yield worker(p)
+        return
+
+    # forked workers would inherit (and print again) batched console lines
+    flush_console()
+    pending = path_strs
+    while pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(worker, p) for p in pending]
+            for done, (path_str, future) in enumerate(zip(pending, futures)):
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    # any worker may have died; find out whether it was this file
+                    yield _run_isolated(worker, path_str)
+                    pending = pending[done + 1 :]
+                    break
+                except Exception as exc:
+                    result = _error_result(path_str, exc)
+                yield result
+            else:
+                pending = []
+
+
+def decoded_line(result: dict) -> str:
+    """One JSON line with a file's decoder summaries, for --decode-out."""
+    line = {"path": result["path"], "streams": result["decoded"]}
+    return json.dumps(line, ensure_ascii=False) + "\n"
+
+
+def run_batch(
+    paths,
+    workers: int | None = None,
+    show_each: bool = True,
+    store_dir: Path | None = None,
+    state_path: Path | None = None,
+    use_hash: bool = False,
+    mapped: bool = False,
+    decode: bool = False,
+    dump: bool = True,
+    limits: dict | None = None,
+    decode_out: Path | None = None,
+):
+    """
+    Run inspect_batch and print an aggregated summary. Returns exit code.
+
+    With state_path, files whose size/mtime (or sha256, with use_hash)
+    match the previous run are reported as cached and not re-extracted.
+    With decode, in-memory decoder results are counted per file and, with
+    decode_out, written there as one JSON line per file; limits bound the
+    decompression of each stream (see rfa_gzip.LIMITS).
+    """
+    start = time.perf_counter()
+    ok = 0
+    failed = []
+    cached = 0
+    total_streams = 0
+    total_bytes = 0
+    bytes_written = 0
+    decoded_ok = 0
+    decode_failed = 0
+    decode_aborted = 0
+
+    worker = partial(
+        _inspect_worker,
+        limits=limits,
+        use_hash=use_hash and state_path is not None,
+        mapped=mapped,
+        decode=decode,
+        dump=dump,
+    )
+    mode = "bin"
+    if not dump:
+        mode = "none"
+    elif store_dir is not None:
+        worker = partial(worker, store_dir=str(store_dir))
+        mode = f"store:{Path(store_dir).resolve()}"
+    if decode:
+        # a decode pass is a different job than a plain dump of the same file
+        mode = f"{mode}+decode"
+
+    state = load_state(state_path) if state_path is not None else {}
+    todo = []
+    for p in paths:
+        try:
+            unchanged = is_unchanged(p, state.get(state_key(p)), mode, use_hash)
+        except OSError:
+            unchanged = False
+        if unchanged:
+            cached += 1
+            if show_each:
+                safe_print(f"cached {p}")
+        else:
+            todo.append(p)
+
+    decoded_fh = (
+        open(decode_out, "w", encoding="utf-8") if decode_out is not None else None
+    )
+    try:
+        for result in inspect_batch(todo, workers=workers, worker=worker):
+            if result["status"] != "ok":
+                failed.append(result)
+                if show_each:
+                    safe_print(f"error  {result['path']}: {result['error']}")
+                    # batched lines would otherwise hide per-file progress
+                    flush_console()
+                continue
+
+            ok += 1
+            total_streams += result["streams"]
+            total_bytes += result["bytes"]
+            bytes_written += result["bytes_written"]
+            for entry in result["decoded"].values():
+                if entry["status"] == "ok":
+                    decoded_ok += 1
+                elif entry["status"] == "aborted":
+                    decode_aborted += 1
+                else:
+                    decode_failed += 1
+            if decoded_fh is not None:
+                decoded_fh.write(decoded_line(result))
+            if state_path is not None:
+                state[state_key(result["path"])] = make_entry(result, mode)
+            if show_each:
+                safe_print(
+                    f"ok     {result['path']} "
+                    f"({result['streams']} streams, {result['bytes']} bytes)"
+                )
+                flush_console()
+    finally:
+        if decoded_fh is not None:
+            decoded_fh.close()
+        # keep progress even when a long run is interrupted
+        if state_path is not None:
+            save_state(state_path, state)
+
+    elapsed = time.perf_counter() - start
+    total = ok + len(failed) + cached
 
     safe_print("=" * 80)
-    safe_print("Done. For each stream there is a .bin in:")
-    safe_print(str(report_dir))
+    safe_print("Batch summary:")
+    safe_print(f"  files:    {total}")
+    safe_print(f"  ok:       {ok}")
+    safe_print(f"  failed:   {len(failed)}")
+    safe_print(f"  cached:   {cached}")
+    safe_print(f"  streams:  {total_streams}")
+    safe_print(f"  bytes:    {total_bytes}")
+    safe_print(f"  written:  {bytes_written}")
+    if decode:
+        safe_print(
+            f"  decoded:  {decoded_ok} streams ({decode_failed} failed, "
+            f"{decode_aborted} aborted)"
+        )
+    safe_print(f"  elapsed:  {elapsed:.2f} s")
+    if elapsed > 0:
+        safe_print(f"  rate:     {total / elapsed:.1f} files/s")
+    if failed:
+        safe_print("\nFailed files:")
+        for result in failed:
+            safe_print(f"  {result['path']}: {result['error']}")
+
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Dump all OLE streams of one or many .rfa files."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["racbasicsamplefamily.rfa"],
+        help="RFA files, directories, glob patterns or @list.txt files "
+             "(default: racbasicsamplefamily.rfa)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch mode (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Force batch mode (quiet per-file output plus summary)",
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="In batch mode, only print failures and the final summary",
+    )
+    parser.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help="Only read and decode BasicFileInfo; print one JSON line per "
+             "file and write nothing to disk",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="Write streams to this content-addressed store (deduplicated "
+             "across files) plus a manifest.json per file instead of .bin files",
+    )
+    parser.add_argument(
+        "--headers-only",
+        action="store_true",
+        help="Print size, first 64 bytes and strings of each stream, reading "
+             "only the sectors needed; write nothing",
+    )
+    parser.add_argument(
+        "--decode",
+        action="store_true",
+        help="Also run the in-memory decoders (BasicFileInfo, Contents, "
+             "Formats/Latest, Global/ElemTable, ...) on the streams they know",
+    )
+    parser.add_argument(
+        "--no-dump",
+        action="store_true",
+        help="Do not write .bin files or store blobs (e.g. with --decode)",
+    )
+    parser.add_argument(
+        "--decode-out",
+        type=Path,
+        default=None,
+        help="With --decode, write each file's decoder summaries to this "
+             "file as one JSON line per file (also works with --no-dump)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Memory-map each file and pass streams on as views into the "
+             "mapping instead of copied bytes (read-only analysis of large "
+             "files)",
+    )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=None,
+        help="Incremental mode: remember processed files in this JSON state "
+             "file and skip unchanged ones on the next run",
+    )
+    parser.add_argument(
+        "--hash",
+        action="store_true",
+        help="With --state, also compare sha256 so touched-but-identical "
+             "files are still skipped",
+    )
+    parser.add_argument(
+        "--max-output-mb",
+        type=float,
+        default=DEFAULT_MAX_OUTPUT / (1024 * 1024),
+        help="Abort decompressing a stream past this many MB "
+             f"(default: {DEFAULT_MAX_OUTPUT // (1024 * 1024)}, 0 = no limit)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=DEFAULT_TIME_BUDGET,
+        help="Abort decompressing a stream after this many CPU seconds "
+             f"(default: {DEFAULT_TIME_BUDGET:g}, 0 = no limit)",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    limits = {
+        "max_output": int(args.max_output_mb * 1024 * 1024) or None,
+        "time_budget": args.time_budget or None,
+    }
+    set_limits(**limits)
+
+    if args.metadata_only:
+        paths = collect_rfa_paths(args.inputs)
+        if not paths:
+            safe_print("No .rfa files found.")
+            return 1
+        # the pool only pays off once there is enough work to spread
+        workers = args.workers if args.workers is not None else (
+            None if len(paths) >= 64 else 1
+        )
+        failed = 0
+        for result in inspect_batch(paths, workers=workers, worker=_metadata_worker):
+            failed += result["status"] != "ok"
+            safe_print(json.dumps(result, ensure_ascii=False))
+        return 1 if failed else 0
+
+    if args.headers_only:
+        paths = collect_rfa_paths(args.inputs)
+        if not paths:
+            safe_print("No .rfa files found.")
+            return 1
+        failed = 0
+        for path in paths:
+            try:
+                inspect_rfa(
+                    path, headers_only=True, mapped=args.mmap, decode=args.decode
+                )
+            except Exception as exc:
+                safe_print(f"{path}: {type(exc).__name__}: {exc}")
+                failed += 1
+        return 1 if failed else 0
+
+    single = (
+        not args.batch
+        and args.state is None
+        and len(args.inputs) == 1
+        and not args.inputs[0].startswith("@")
+        and not glob.has_magic(args.inputs[0])
+        and not Path(args.inputs[0]).is_dir()
+    )
+
+    if single:
+        try:
+            result = inspect_rfa(
+                Path(args.inputs[0]),
+                store_dir=args.store,
+                mapped=args.mmap,
+                decode=args.decode,
+                dump=not args.no_dump,
+            )
+        except FileNotFoundError as exc:
+            safe_print(str(exc))
+            return 1
+        if args.decode and args.decode_out is not None:
+            args.decode_out.write_text(decoded_line(result), encoding="utf-8")
+        return 0
+
+    paths = collect_rfa_paths(args.inputs)
+    if not paths:
+        safe_print("No .rfa files found.")
+        return 1
+
+    return run_batch(
+        paths,
+        workers=args.workers,
+        show_each=not args.summary_only,
+        store_dir=args.store,
+        state_path=args.state,
+        use_hash=args.hash,
+        mapped=args.mmap,
+        decode=args.decode,
+        dump=not args.no_dump,
+        limits=limits,
+        decode_out=args.decode_out if args.decode else None,
+    )
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        rfa_path = Path(sys.argv[1])
-    else:
-        rfa_path = Path("racbasicsamplefamily.rfa")
-
-    inspect_rfa(rfa_path)
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+import olefile
+
+from _Extract_RFA_V2 import collect_rfa_paths, inspect_batch, read_basic_file_info
+from rfa_output import safe_print, setup_console
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    status TEXT NOT NULL,
+    error TEXT,
+    format TEXT,
+    build TEXT,
+    unique_document_guid TEXT,
+    last_save_path TEXT,
+    locale_when_saved TEXT,
+    username TEXT,
+    author TEXT,
+    worksharing TEXT,
+    metadata_json TEXT,
+    indexed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_files_guid ON files(unique_document_guid);
+CREATE INDEX IF NOT EXISTS idx_files_build ON files(build);
+CREATE INDEX IF NOT EXISTS idx_files_format ON files(format);
+
+CREATE TABLE IF NOT EXISTS streams (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (path, name)
+) WITHOUT ROWID;
+"""
+
+# metadata keys from parse_kv_lines that get their own column
+META_COLUMNS = (
+    "format",
+    "build",
+    "unique_document_guid",
+    "last_save_path",
+    "locale_when_saved",
+    "username",
+    "author",
+    "worksharing",
+)
+
+FILE_COLUMNS = (
+    "path", "size", "mtime_ns", "status", "error",
+) + META_COLUMNS + ("metadata_json", "indexed_at")
+
+UPSERT_FILE = "INSERT INTO files ({cols}) VALUES ({marks}) " \
+    "ON CONFLICT(path) DO UPDATE SET {updates}".format(
+        cols=", ".join(FILE_COLUMNS),
+        marks=", ".join("?" for _ in FILE_COLUMNS),
+        updates=", ".join(f"{c} = excluded.{c}" for c in FILE_COLUMNS[1:]),
+    )
+
+
+def open_index(db_path: Path):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _index_worker(path_str: str):
+    """
+    Collect what the index needs for one file: stream sizes (from the
+    directory, no stream reads) and the decoded BasicFileInfo.
+    Never raises; failures are recorded as status.
+    """
+    path = Path(path_str)
+    result = {"path": path_str, "streams": {}, "metadata": {}}
+    try:
+        st = path.stat()
+        result["size"] = st.st_size
+        result["mtime_ns"] = st.st_mtime_ns
+        with olefile.OleFileIO(path_str) as ole:
+            for stream in ole.listdir(streams=True, storages=False):
+                result["streams"]["/".join(stream)] = ole.get_size(stream)
+            result["metadata"] = read_basic_file_info(path, ole)
+        result["status"] = "ok"
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def _file_row(result: dict, now: float):
+    meta = result["metadata"]
+    return (
+        result["path"],
+        result.get("size"),
+        result.get("mtime_ns"),
+        result["status"],
+        result.get("error"),
+    ) + tuple(meta.get(k) for k in META_COLUMNS) + (
+        json.dumps(meta, ensure_ascii=False) if meta else None,
+        now,
+    )
+
+
+def write_results(conn, results):
+    """Write one batch of worker results in a single transaction."""
+    now = time.time()
+    with conn:
+        conn.executemany(UPSERT_FILE, [_file_row(r, now) for r in results])
+        conn.executemany(
+            "DELETE FROM streams WHERE path = ?",
+            [(r["path"],) for r in results],
+        )
+        conn.executemany(
+            "INSERT INTO streams (path, name, size) VALUES (?, ?, ?)",
+            [
+                (r["path"], name, size)
+                for r in results
+                for name, size in r["streams"].items()
+            ],
+        )
+
+
+def index_files(conn, paths, workers: int | None = None, batch_size: int = 1000):
+    """Index paths into conn, committing every batch_size files. Returns (ok, failed)."""
+    # rows are keyed by the resolved path, so a file reached through
+    # different relative paths or links is indexed once
+    paths = list(dict.fromkeys(Path(p).resolve() for p in paths))
+    ok = 0
+    failed = 0
+    pending = []
+    for result in inspect_batch(paths, workers=workers, worker=_index_worker):
+        if result["status"] == "ok":
+            ok += 1
+        else:
+            failed += 1
+        pending.append(result)
+        if len(pending) >= batch_size:
+            write_results(conn, pending)
+            pending = []
+    if pending:
+        write_results(conn, pending)
+    return ok, failed
+
+
+def query_files(conn, build_prefix=None, format_=None, guid=None, limit=None):
+    """
+    Query indexed files. build_prefix uses a range scan on idx_files_build
+    (e.g. "2019" -> all builds 2019xxxx_xxxx).
+    """
+    where = []
+    params = []
+    if build_prefix:
+        where.append("build >= ? AND build < ?")
+        params += [build_prefix, build_prefix[:-1] + chr(ord(build_prefix[-1]) + 1)]
+    if format_:
+        where.append("format = ?")
+        params.append(format_)
+    if guid:
+        where.append("unique_document_guid = ?")
+        params.append(guid.lower())
+    sql = "SELECT path, format, build, unique_document_guid, status FROM files"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY path"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index BasicFileInfo metadata and stream sizes of a family "
+                    "library into SQLite, or query that index."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="RFA files, directories, glob patterns or @list.txt files to index",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=Path("rfa_index.sqlite"),
+        help="SQLite database (default: rfa_index.sqlite)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Files per transaction (default: 1000)",
+    )
+    parser.add_argument("--build", help="Query: builds starting with this prefix")
+    parser.add_argument("--format", dest="format_", help="Query: exact format, e.g. 2020")
+    parser.add_argument("--guid", help="Query: unique document GUID")
+    parser.add_argument("--limit", type=int, default=None, help="Query: max rows")
+    args = parser.parse_args()
+    setup_console()
+
+    conn = open_index(args.db)
+
+    if args.inputs:
+        paths = collect_rfa_paths(args.inputs)
+        start = time.perf_counter()
+        ok, failed = index_files(
+            conn, paths, workers=args.workers, batch_size=args.batch_size
+        )
+        elapsed = time.perf_counter() - start
+        safe_print(f"Indexed {ok + failed} files into {args.db} "
+                   f"({ok} ok, {failed} failed) in {elapsed:.2f} s")
+
+    if args.build or args.format_ or args.guid:
+        start = time.perf_counter()
+        rows = query_files(
+            conn,
+            build_prefix=args.build,
+            format_=args.format_,
+            guid=args.guid,
+            limit=args.limit,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        for path, fmt, build, guid, status in rows:
+            safe_print(f"{fmt or '-':<6} {build or '-':<20} {guid or '-':<36} {path}")
+        safe_print(f"({len(rows)} rows in {elapsed:.1f} ms)")
+    elif not args.inputs:
+        count = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        safe_print(f"{args.db}: {count} files indexed")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+import argparse
+import fnmatch
+import json
+from pathlib import Path
+
+import olefile
+
+from _Extract_RFA_V2 import collect_rfa_paths
+from rfa_gzip import iter_inflate
+from rfa_olestream import open_lazy_stream
+from rfa_output import safe_print, setup_console
+from rfa_stride import DEFAULT_MAX_HEADER, DEFAULT_MAX_STRIDE, rank_strides
+
+
+def decompressed(fileobj, raw: bool = False):
+    """
+    All gzip members of a stream, concatenated; the stream itself when it
+    holds none (or with raw). Returns (data, was_compressed).
+    """
+    if not raw:
+        data = b"".join(chunk for _, chunk in iter_inflate(fileobj))
+        if data:
+            return data, True
+    fileobj.seek(0)
+    return fileobj.read(), False
+
+
+def iter_buffers(path: Path, pattern: str, raw: bool):
+    """Yield (stream name, data, was_compressed) for a .bin or each .rfa stream."""
+    if path.suffix.lower() in (".rfa", ".rvt", ".rte", ".rft"):
+        with olefile.OleFileIO(str(path)) as ole:
+            for stream in ole.listdir(streams=True, storages=False):
+                name = "/".join(stream)
+                if fnmatch.fnmatchcase(name, pattern):
+                    yield (name, *decompressed(open_lazy_stream(ole, stream), raw))
+    else:
+        with open(path, "rb") as fh:
+            yield (path.name, *decompressed(fh, raw))
+
+
+def describe(candidate: dict) -> str:
+    line = (
+        f"  stride {candidate['stride']:>4}  score {candidate['score']:.3f}  "
+        f"match {candidate['match']:.0%}"
+    )
+    if candidate["column_entropy"] is not None:
+        line += f"  column entropy {candidate['column_entropy']:.2f}"
+    field = candidate["count_field"]
+    if field:
+        line += (
+            f"  header {field['header']} (u{field['field_width'] * 8} count "
+            f"{field['count']} at 0x{field['field_offset']:X}, "
+            f"covers {field['coverage']:.0%})"
+        )
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rank likely fixed record sizes (strides) and header "
+                    "sizes of decompressed streams."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["racbasicsamplefamily.rfa"],
+        help="RFA files, directories, glob patterns, @list.txt files or "
+             "dumped .bin streams (default: racbasicsamplefamily.rfa)",
+    )
+    parser.add_argument(
+        "--stream",
+        default="*",
+        help="Only streams matching this pattern, e.g. 'Global/*' (default: all)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=3,
+        help="Candidates per stream (default: 3)",
+    )
+    parser.add_argument(
+        "--max-stride",
+        type=int,
+        default=DEFAULT_MAX_STRIDE,
+        help=f"Largest record size to try (default: {DEFAULT_MAX_STRIDE})",
+    )
+    parser.add_argument(
+        "--max-header",
+        type=int,
+        default=DEFAULT_MAX_HEADER,
+        help="Look for a record count in this many leading bytes "
+             f"(default: {DEFAULT_MAX_HEADER})",
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Analyse the stream bytes as stored, without inflating gzip members",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON line per stream instead",
+    )
+    args = parser.parse_args()
+    setup_console()
+
+    bins = [Path(i) for i in args.inputs if i.lower().endswith(".bin")]
+    paths = bins + collect_rfa_paths(
+        [i for i in args.inputs if not i.lower().endswith(".bin")]
+    )
+    if not paths:
+        safe_print("No input files found.")
+        return 1
+
+    failed = 0
+    for path in paths:
+        try:
+            for name, data, compressed in iter_buffers(path, args.stream, args.raw):
+                candidates, entropy = rank_strides(
+                    data, args.max_stride, args.max_header, args.top
+                )
+                if args.json:
+                    safe_print(json.dumps({
+                        "path": str(path),
+                        "stream": name,
+                        "size": len(data),
+                        "decompressed": compressed,
+                        "entropy": entropy,
+                        "candidates": candidates,
+                    }))
+                    continue
+                safe_print(
+                    f"{path} :: {name}  ({len(data)} bytes"
+                    f"{' decompressed' if compressed else ''}, "
+                    f"entropy {entropy:.2f} bits/byte)"
+                )
+                for candidate in candidates:
+                    safe_print(describe(candidate))
+                if not candidates:
+                    safe_print("  no periodic structure found")
+        except Exception as exc:
+            safe_print(f"{path}: {type(exc).__name__}: {exc}")
+            failed += 1
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+import fnmatch
+
+from rfa_gzip import (
+    LIMITS, DecompressionLimitError, ViewReader, find_and_decompress_gzip,
+    iter_inflate, locate_gzip,
+)
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# Decoders run on in-memory stream data (bytes or memoryview) and return a
+# small JSON-serialisable summary. The decoder scripts are imported on first
+# use, so a missing optional dependency (e.g. numpy) only fails its stream.
+# Inflating is bounded by rfa_gzip.LIMITS (see rfa_gzip.set_limits).
+
+
+def decode_basic_file_info_stream(data):
+    from BasicFileInfo_Decode_V6 import decode_basic_file_info
+
+    meta, _, _, _ = decode_basic_file_info(bytes(data))
+    return meta
+
+
+def decode_contents(data):
+    from Contents_Decode_V2 import guess_metadata
+    from rfa_strings import utf16le_strings_all_alignments
+
+    _, _, decomp = find_and_decompress_gzip(data)
+    if decomp is None:
+        raise ValueError("No valid gzip segment found")
+    author, build = guess_metadata(utf16le_strings_all_alignments(decomp, 4))
+    return {
+        "decompressed_size": len(decomp),
+        "author_candidate": author,
+        "build_candidate": build,
+    }
+
+
+def decode_formats_latest(data, cache: bool = True):
+    from Formats_Latest_Decode_V2 import DEFAULT_CACHE_DIR, load_catalog
+
+    catalog, hit = load_catalog(bytes(data), DEFAULT_CACHE_DIR if cache else None)
+    return {
+        "classes": len(catalog["classes"]),
+        "fields": sum(len(c["fields"]) for c in catalog["classes"]),
+        "decompressed_size": catalog["decompressed_size"],
+        "catalog_cache_hit": hit,
+    }
+
+
+def decode_elem_table(data):
+    from Global_ElemTable_Decode_V2 import (
+        decompress_elem_table, parse_elem_table, summarize_elem_table,
+    )
+
+    return summarize_elem_table(parse_elem_table(decompress_elem_table(data)))
+
+
+def decode_document_increments(data):
+    from Global_DocumentIncrementTable_Decode_V2 import (
+        parse_document_increments, summarize_increments,
+    )
+
+    _, _, decomp = find_and_decompress_gzip(data)
+    if decomp is None:
+        raise ValueError("No valid gzip segment found")
+    return summarize_increments(parse_document_increments(decomp))
+
+
+def decode_gzip_member(data):
+    """Generic summary for streams that hold one gzip member."""
+    member = locate_gzip(data, verify=False)
+    if member is None:
+        raise ValueError("No gzip member found")
+    return {
+        "gzip_offset": member["start"],
+        "compressed_size": member["end"] - member["start"],
+        "decompressed_size": len(member["data"]),
+        "crc_ok": member["crc_ok"] and member["size_ok"],
+    }
+
+
+def decode_partition(data):
+    """Inflate every member with bounded memory; sizes and statuses only."""
+    members = []
+    # ViewReader, not BytesIO: a mapped stream (--mmap) stays uncopied
+    for _ in iter_inflate(ViewReader(data), members=members):
+        pass
+    if members and members[-1]["status"] == "aborted":
+        limit = members[-1]["limit"]
+        raise DecompressionLimitError(limit, b"", LIMITS[limit])
+    return {
+        "members": len(members),
+        "decompressed_size": sum(m["size"] for m in members),
+        "bad_members": sum(m["status"] != "ok" for m in members),
+    }
+
+
+def decode_preview(data):
+    idx = bytes(data).find(PNG_MAGIC)
+    if idx == -1:
+        raise ValueError("No PNG header found")
+    return {"png_offset": idx, "png_size": len(data) - idx}
+
+
+# stream name (or fnmatch pattern) -> decoder
+DECODERS = {
+    "BasicFileInfo": decode_basic_file_info_stream,
+    "Contents": decode_contents,
+    "Formats/Latest": decode_formats_latest,
+    "Global/ContentDocuments": decode_gzip_member,
+    "Global/DocumentIncrementTable": decode_document_increments,
+    "Global/ElemTable": decode_elem_table,
+    "Partitions/*": decode_partition,
+    "RevitPreview4.0": decode_preview,
+}
+
+
+# decoders that keep an on-disk cache; they take cache=False to neither
+# read nor write it
+CACHING_DECODERS = {decode_formats_latest}
+
+
+def find_decoder(stream_name: str):
+    """Decoder for a stream name ("Global/ElemTable"), or None."""
+    decoder = DECODERS.get(stream_name)
+    if decoder is None:
+        for pattern, func in DECODERS.items():
+            if fnmatch.fnmatchcase(stream_name, pattern):
+                return func
+    return decoder
+
+
+def decode_stream(stream_name: str, data, cache: bool = True):
+    """
+    Run the registered decoder; never raises. cache=False keeps decoders
+    from touching their on-disk caches (e.g. formats_cache/).
+    Returns {"status": "ok", "summary": {...}},
+    {"status": "aborted", "limit": ..., "error": "..."} when inflating
+    hit a limit, or {"status": "error", "error": "..."}.
+    """
+    decoder = find_decoder(stream_name)
+    if decoder is None:
+        return {"status": "error", "error": "No decoder registered"}
+    options = {"cache": cache} if decoder in CACHING_DECODERS else {}
+    try:
+        return {"status": "ok", "summary": decoder(data, **options)}
+    except DecompressionLimitError as exc:
+        return {"status": "aborted", "limit": exc.limit, "error": str(exc)}
+    except Exception as exc:
+        return {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
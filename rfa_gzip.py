@@ -0,0 +1,503 @@
+import io
+import struct
+import time
+import zlib
+
+GZIP_MAGIC = b"\x1f\x8b\x08"
+
+DEFAULT_READ_SIZE = 64 * 1024
+DEFAULT_MAX_BUFFER = 1024 * 1024
+MAX_HEADER_SIZE = 64 * 1024
+
+# Per-stream safety limits, so one malformed family can't exhaust memory or
+# stall a batch worker: decompressed bytes, and CPU seconds spent inflating.
+# None disables a limit. The functions below use LIMITS unless given their own.
+DEFAULT_MAX_OUTPUT = 512 * 1024 * 1024
+DEFAULT_TIME_BUDGET = 30.0
+LIMITS = {"max_output": DEFAULT_MAX_OUTPUT, "time_budget": DEFAULT_TIME_BUDGET}
+
+
+class DecompressionLimitError(ValueError):
+    """
+    Inflating a stream was aborted at a limit. limit is "max_output" or
+    "time_budget", data the output up to that point (at most max_output
+    bytes), so callers can still use or report the truncated result.
+    """
+
+    def __init__(self, limit: str, data: bytes, value):
+        self.limit = limit
+        self.data = data
+        if limit == "max_output":
+            super().__init__(f"Output exceeds the {value} byte limit")
+        else:
+            super().__init__(f"Inflating took more than {value} s of CPU time")
+
+
+def set_limits(
+    max_output: int | None = DEFAULT_MAX_OUTPUT,
+    time_budget: float | None = DEFAULT_TIME_BUDGET,
+):
+    """Set the process-wide LIMITS, e.g. from a command line or a batch worker."""
+    LIMITS["max_output"] = max_output
+    LIMITS["time_budget"] = time_budget
+
+
+class _Budget:
+    """Output bytes and inflate CPU time of one stream, against a limits dict."""
+
+    def __init__(self, limits: dict | None = None):
+        limits = LIMITS if limits is None else limits
+        self.max_output = limits.get("max_output")
+        self.time_budget = limits.get("time_budget")
+        self.size = 0
+        self.seconds = 0.0
+
+    def inflate(self, obj, data, max_length: int):
+        """obj.decompress(data, max_length), timed and counted."""
+        if self.max_output is not None:
+            # one byte over the limit is enough to know it was exceeded
+            max_length = max(1, min(max_length, self.max_output - self.size + 1))
+        started = time.process_time()
+        out = obj.decompress(data, max_length)
+        self.seconds += time.process_time() - started
+        self.size += len(out)
+        return out
+
+    def exceeded(self):
+        """The limit that was hit ("max_output" or "time_budget"), or None."""
+        if self.max_output is not None and self.size > self.max_output:
+            return "max_output"
+        if self.time_budget is not None and self.seconds > self.time_budget:
+            return "time_budget"
+        return None
+
+    def error(self, limit: str, data: bytes):
+        if limit == "max_output":
+            return DecompressionLimitError(
+                limit, data[: self.max_output], self.max_output
+            )
+        return DecompressionLimitError(limit, data, self.time_budget)
+
+
+def inflate_bounded(
+    data,
+    wbits: int = -zlib.MAX_WBITS,
+    limits: dict | None = None,
+    read_size: int = DEFAULT_READ_SIZE,
+    max_buffer: int = DEFAULT_MAX_BUFFER,
+):
+    """
+    Decompress data incrementally, read_size input bytes and at most
+    max_buffer output bytes per step, checking the limits after each step.
+
+    Returns (output, end): end is the offset in data just past the
+    compressed stream, or None when data ended before the stream did.
+    Raises zlib.error for invalid data and DecompressionLimitError (with
+    the output so far) when a limit is hit.
+    """
+    view = memoryview(data).cast("B")
+    obj = zlib.decompressobj(wbits=wbits)
+    budget = _Budget(limits)
+    parts = []
+    pos = 0
+    while not obj.eof:
+        chunk = obj.unconsumed_tail
+        if not chunk and pos < len(view):
+            chunk = view[pos : pos + read_size]
+            pos += len(chunk)
+        out = budget.inflate(obj, chunk, max_buffer)
+        parts.append(out)
+        limit = budget.exceeded()
+        if limit:
+            raise budget.error(limit, b"".join(parts))
+        if not out and not chunk:
+            break
+    end = pos - len(obj.unused_data) if obj.eof else None
+    return b"".join(parts), end
+
+
+def parse_gzip_header(data, offset: int = 0):
+    """
+    Parse a gzip member header starting at offset.
+    Returns a dict with the header fields and the absolute payload offset.
+    """
+    if len(data) < offset + 10 or bytes(data[offset : offset + 2]) != b"\x1f\x8b":
+        raise ValueError("Not a gzip stream")
+    cm = data[offset + 2]
+    flg = data[offset + 3]
+    mtime = struct.unpack_from("<I", data, offset + 4)[0]
+    xfl = data[offset + 8]
+    os_id = data[offset + 9]
+    pos = offset + 10
+    extra = b""
+    name = None
+    comment = None
+    if flg & 0x04:
+        if pos + 2 > len(data):
+            raise ValueError("Invalid gzip header (FEXTRA)")
+        xlen = struct.unpack_from("<H", data, pos)[0]
+        pos += 2
+        extra = bytes(data[pos : pos + xlen])
+        pos += xlen
+    if flg & 0x08:
+        start = pos
+        while pos < len(data) and data[pos] != 0:
+            pos += 1
+        name = bytes(data[start:pos]).decode("latin1", errors="ignore")
+        pos += 1
+    if flg & 0x10:
+        start = pos
+        while pos < len(data) and data[pos] != 0:
+            pos += 1
+        comment = bytes(data[start:pos]).decode("latin1", errors="ignore")
+        pos += 1
+    if flg & 0x02:
+        pos += 2
+    if pos > len(data):
+        raise ValueError("Truncated gzip header")
+    return {
+        "cm": cm,
+        "flg": flg,
+        "mtime": mtime,
+        "xfl": xfl,
+        "os": os_id,
+        "extra": extra,
+        "name": name,
+        "comment": comment,
+        "payload_offset": pos,
+    }
+
+
+def inflate_gzip_member(blob, start: int, limits: dict | None = None):
+    """
+    Inflate one gzip member that begins at start, in a single pass.
+
+    Returns a dict with start, end (just past the 8-byte trailer), data,
+    header, crc32/isize from the trailer and crc_ok/size_ok flags.
+    Raises ValueError when the member is not complete, and its subclass
+    DecompressionLimitError when it exceeds the limits (see LIMITS).
+    """
+    header = parse_gzip_header(blob, start)
+    payload_offset = header["payload_offset"]
+    view = memoryview(blob)[payload_offset:]
+
+    try:
+        data, end = inflate_bounded(view, limits=limits)
+    except zlib.error as exc:
+        raise ValueError(f"Invalid deflate data: {exc}") from exc
+    if end is None:
+        raise ValueError("Truncated deflate stream")
+
+    deflate_end = payload_offset + end
+    if deflate_end + 8 > len(blob):
+        raise ValueError("Truncated gzip trailer")
+    crc32, isize = struct.unpack_from("<II", blob, deflate_end)
+
+    return {
+        "start": start,
+        "end": deflate_end + 8,
+        "data": data,
+        "header": header,
+        "crc32": crc32,
+        "isize": isize,
+        "crc_ok": (zlib.crc32(data) & 0xFFFFFFFF) == crc32,
+        "size_ok": (len(data) & 0xFFFFFFFF) == isize,
+    }
+
+
+def locate_gzip(
+    blob, start: int = 0, verify: bool = True, limits: dict | None = None
+):
+    """
+    Find the first complete gzip member at or after start.
+
+    Walks candidate headers (1F 8B 08) forward and inflates each once;
+    no end-offset guessing. With verify=True a member only counts when its
+    CRC32 and ISIZE trailer match, like gzip.decompress.
+    Returns the inflate_gzip_member dict plus "unused" (bytes after the
+    member), or None. A DecompressionLimitError ends the search.
+    """
+    blob = bytes(blob) if not isinstance(blob, (bytes, bytearray)) else blob
+    pos = blob.find(GZIP_MAGIC, start)
+    while pos != -1:
+        try:
+            member = inflate_gzip_member(blob, pos, limits)
+        except DecompressionLimitError:
+            raise
+        except ValueError:
+            member = None
+        if member is not None and (
+            not verify or (member["crc_ok"] and member["size_ok"])
+        ):
+            member["unused"] = blob[member["end"] :]
+            return member
+        pos = blob.find(GZIP_MAGIC, pos + 1)
+    return None
+
+
+def iter_gzip_members(
+    blob, start: int = 0, verify: bool = True, limits: dict | None = None
+):
+    """
+    Yield every gzip member in blob, e.g. the chunks of a Partitions stream.
+    The limits apply to each member.
+    """
+    pos = start
+    while True:
+        member = locate_gzip(blob, pos, verify=verify, limits=limits)
+        if member is None:
+            return
+        yield member
+        pos = member["end"]
+
+
+def find_and_decompress_gzip(blob: bytes, limits: dict | None = None):
+    """
+    Search for a gzip header (1F 8B 08) and decompress the member in one
+    linear pass.
+
+    Returns (start_offset, end_offset, decompressed_bytes)
+    or (None, None, None) if nothing is found. Raises
+    DecompressionLimitError when the member exceeds the limits.
+    """
+    member = locate_gzip(blob, limits=limits)
+    if member is None:
+        return None, None, None
+    return member["start"], member["end"], member["data"]
+
+
+def _inflate_until_error(obj, data):
+    """
+    Output of obj for data up to the first invalid byte. Fed one byte at a
+    time, so nothing decoded before the error is discarded with it; only
+    used after a larger call has failed (its output stays < max_buffer).
+    """
+    parts = []
+    for i in range(len(data)):
+        try:
+            parts.append(obj.decompress(data[i : i + 1]))
+        except zlib.error:
+            break
+        if obj.eof:
+            break
+    return b"".join(parts)
+
+
+class ViewReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a bytes-like object (e.g. a
+    memoryview into an mmap). Unlike io.BytesIO it does not copy the
+    buffer; each read() copies only the bytes it returns.
+    """
+
+    def __init__(self, data):
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast("B")
+        got = max(0, min(len(view), len(self._view) - self._pos))
+        view[:got] = self._view[self._pos : self._pos + got]
+        self._pos += got
+        return got
+
+    def read(self, size: int = -1):
+        start = min(self._pos, len(self._view))
+        end = len(self._view) if size is None or size < 0 else start + size
+        chunk = bytes(self._view[start:end])
+        self._pos = start + len(chunk)
+        return chunk
+
+
+def iter_inflate(
+    fileobj,
+    read_size: int = DEFAULT_READ_SIZE,
+    max_buffer: int = DEFAULT_MAX_BUFFER,
+    members: list | None = None,
+    limits: dict | None = None,
+):
+    """
+    Stream-decompress every gzip member found in a file-like object
+    (an OLE stream, an open .bin file, a ViewReader over in-memory data).
+
+    Yields (member_index, chunk) with len(chunk) <= max_buffer, so memory
+    stays around read_size + max_buffer no matter how large the stream is.
+    Bytes between members (e.g. the 32-byte partition chunk headers) are
+    skipped. A corrupt member yields everything decoded before the bad
+    data, independent of read_size and max_buffer. If a list is passed as
+    members, one dict per member is appended: start, end, compressed_size,
+    size, crc32, crc_ok, size_ok, status ("ok", "corrupt", "truncated" or
+    "aborted") and limit.
+
+    The limits (see LIMITS) apply to the stream as a whole: once the
+    output of all members, or the CPU time spent inflating them, exceeds
+    them, the current member is recorded as "aborted" with limit
+    "max_output" or "time_budget" and iteration stops. Output is cut at
+    max_output bytes.
+    """
+    budget = _Budget(limits)
+    seekable = getattr(fileobj, "seekable", lambda: False)()
+    base = fileobj.tell() if seekable else 0
+    buf = b""
+    buf_off = 0  # offset of buf[0], relative to where reading started
+    at_eof = False
+    index = 0
+
+    def read_more():
+        nonlocal buf, at_eof
+        chunk = fileobj.read(read_size)
+        if not chunk:
+            at_eof = True
+            return False
+        buf += chunk
+        return True
+
+    while True:
+        # 1. find the next gzip magic
+        idx = buf.find(GZIP_MAGIC)
+        if idx == -1:
+            keep = min(len(buf), len(GZIP_MAGIC) - 1)
+            buf_off += len(buf) - keep
+            buf = buf[len(buf) - keep :]
+            if at_eof or not read_more():
+                return
+            continue
+        buf_off += idx
+        buf = buf[idx:]
+
+        # 2. make sure the whole header is buffered
+        try:
+            header = parse_gzip_header(buf)
+        except ValueError:
+            if len(buf) < MAX_HEADER_SIZE and not at_eof and read_more():
+                continue
+            buf_off += 1
+            buf = buf[1:]
+            continue
+
+        start = buf_off
+        payload_offset = header["payload_offset"]
+        data = buf[payload_offset:]
+        fed_end = buf_off + len(buf)
+        buf = b""
+
+        # 3. inflate with a bounded output buffer
+        obj = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        crc = 0
+        size = 0
+        status = None
+        limit = None
+        while status is None:
+            try:
+                while data:
+                    saved = obj.copy()
+                    out = budget.inflate(obj, data, max_buffer)
+                    data = obj.unconsumed_tail
+                    limit = budget.exceeded()
+                    if limit == "max_output":
+                        out = out[: len(out) - (budget.size - budget.max_output)]
+                    if out:
+                        crc = zlib.crc32(out, crc)
+                        size += len(out)
+                        yield index, out
+                    if obj.eof or limit:
+                        break
+            except zlib.error:
+                # the failed call's output is lost; replay it so that all
+                # output before the bad data is kept, whatever the chunking
+                out = _inflate_until_error(saved, data)
+                if out:
+                    crc = zlib.crc32(out, crc)
+                    size += len(out)
+                    yield index, out
+                status = "corrupt"
+                break
+            if limit:
+                status = "aborted"
+                break
+            if obj.eof:
+                status = "ok"
+                break
+            data = fileobj.read(read_size)
+            if not data:
+                at_eof = True
+                status = "truncated"
+                break
+            fed_end += len(data)
+
+        if status != "ok":
+            if members is not None:
+                members.append({
+                    "start": start,
+                    "end": None,
+                    "compressed_size": None,
+                    "size": size,
+                    "crc32": None,
+                    "crc_ok": False,
+                    "size_ok": False,
+                    "status": status,
+                    "limit": limit,
+                })
+            index += 1
+            if status in ("truncated", "aborted"):
+                return
+            # resync: rewind just past the bad header when possible
+            if seekable:
+                fileobj.seek(base + start + 1)
+                at_eof = False
+                buf = b""
+                buf_off = start + 1
+            else:
+                buf = data
+                buf_off = fed_end - len(data)
+            continue
+
+        # 4. read the 8-byte trailer
+        buf = obj.unused_data
+        buf_off = fed_end - len(buf)
+        while len(buf) < 8 and not at_eof:
+            read_more()
+        if len(buf) < 8:
+            trailer_crc = trailer_size = None
+        else:
+            trailer_crc, trailer_size = struct.unpack_from("<II", buf, 0)
+            buf_off += 8
+            buf = buf[8:]
+
+        if members is not None:
+            members.append({
+                "start": start,
+                "end": buf_off,
+                "compressed_size": buf_off - start,
+                "size": size,
+                "crc32": trailer_crc,
+                "crc_ok": trailer_crc == (crc & 0xFFFFFFFF),
+                "size_ok": trailer_size == (size & 0xFFFFFFFF),
+                "status": "ok" if trailer_crc is not None else "truncated",
+                "limit": None,
+            })
+        index += 1
@@ -0,0 +1,66 @@
+import argparse
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# byte -> itself if printable ASCII, else "."
+ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+
+def iter_hexdump(
+    data,
+    start: int = 0,
+    length: int | None = None,
+    width: int = 16,
+    offset_format: str = "{:08X}: ",
+    pad: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """
+    Lazily yield hexdump lines for data[start:start + length].
+
+    data can be bytes, bytearray, memoryview or mmap; it is read through a
+    memoryview one chunk at a time, so memory stays constant however large
+    the range is. Each chunk is converted with one bytes.hex() call and
+    one translate() through ASCII_TABLE, then cut into lines.
+
+    Lines look like offset_format.format(offset) + hex bytes padded to pad
+    (default width * 3 - 1) + two spaces + ASCII. Offsets are absolute.
+    """
+    view = memoryview(data).cast("B")
+    end = len(view) if length is None else min(len(view), start + length)
+    if pad is None:
+        pad = width * 3 - 1
+    step = max(width, chunk_size - chunk_size % width)
+    hex_len = width * 3
+
+    for base in range(start, end, step):
+        chunk = bytes(view[base : min(end, base + step)])
+        hexs = chunk.hex(" ").upper()
+        text = chunk.translate(ASCII_TABLE).decode("ascii")
+        for i in range(0, len(chunk), width):
+            hex_part = hexs[i * 3 : i * 3 + hex_len - 1]
+            yield (
+                f"{offset_format.format(base + i)}"
+                f"{hex_part:<{pad}}  {text[i : i + width]}"
+            )
+
+
+def parse_range(spec: str):
+    """
+    "START:LENGTH", "START:" or "" -> (start, length or None).
+    Numbers may be decimal or 0x-prefixed. Usable as an argparse type:
+    bad input raises argparse.ArgumentTypeError.
+    """
+    if not spec:
+        return 0, None
+    start_s, _, length_s = spec.partition(":")
+    try:
+        start = int(start_s, 0) if start_s else 0
+        length = int(length_s, 0) if length_s else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid range {spec!r}, expected START:LENGTH (e.g. 0x100:256)"
+        ) from None
+    if start < 0 or (length is not None and length < 0):
+        raise argparse.ArgumentTypeError(f"invalid range {spec!r}, negative value")
+    return start, length
@@ -0,0 +1,63 @@
+import sys
+from array import array
+
+# memoryview / array type codes by width; "I" is not 4 bytes everywhere
+_CODES = {
+    1: "B",
+    2: "H",
+    4: "I" if array("I").itemsize == 4 else "L",
+    8: "Q",
+}
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def uint_view(data, width: int, offset: int = 0, count: int | None = None):
+    """
+    Little-endian unsigned integers of width bytes (1, 2, 4 or 8) from
+    data[offset:], at most count of them; a trailing partial item is
+    dropped. offset does not have to be aligned.
+
+    On little-endian hosts this is a cast memoryview into data (no copy,
+    no per-element unpacking); index it, iterate it or call tolist().
+    On big-endian hosts a byte-swapped array copy is returned instead.
+    """
+    code = _CODES[width]
+    view = memoryview(data).cast("B")[offset:]
+    n = len(view) // width
+    if count is not None:
+        n = min(n, count)
+    view = view[: n * width]
+    if _LITTLE_ENDIAN:
+        return view.cast(code)
+    values = array(code, view.tobytes())
+    values.byteswap()
+    return values
+
+
+def u8_view(data, offset: int = 0, count: int | None = None):
+    return uint_view(data, 1, offset, count)
+
+
+def u16_view(data, offset: int = 0, count: int | None = None):
+    return uint_view(data, 2, offset, count)
+
+
+def u32_view(data, offset: int = 0, count: int | None = None):
+    return uint_view(data, 4, offset, count)
+
+
+def u64_view(data, offset: int = 0, count: int | None = None):
+    return uint_view(data, 8, offset, count)
+
+
+def u32_pairs(data, offset: int = 0, count: int | None = None):
+    """Lazy (a, b) u32 pairs, e.g. a table of 8-byte records."""
+    values = u32_view(data, offset, None if count is None else 2 * count)
+    if len(values) % 2:
+        values = values[:-1]
+    return zip(values[0::2], values[1::2])
+
+
+def with_offsets(values, width: int, base: int = 0):
+    """[(byte offset, value), ...] for a view returned above."""
+    return [(base + i * width, v) for i, v in enumerate(values)]
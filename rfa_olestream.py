@@ -0,0 +1,220 @@
+import contextlib
+import io
+import mmap
+
+import olefile
+
+READ_CHUNK_SIZE = 1 << 16
+
+
+class LazyOleStream(io.RawIOBase):
+    """
+    Read-only, seekable view of one stream in an OLE compound file.
+
+    Unlike olefile's openstream(), which reads the whole sector chain into
+    a BytesIO up front, nothing is read when the stream is opened. The
+    FAT (or MiniFAT) chain is followed only as far as a read reaches, and
+    only the sectors covering the requested range are read; runs of
+    adjacent sectors are fetched with one read() call.
+
+    fp is the container (the file for normal streams, the mini stream for
+    small ones), base is the offset of sector 0 in fp. buffer, if given,
+    is the same container as a memoryview (e.g. of an mmap); reads then
+    copy straight from it and view() can return zero-copy slices.
+    """
+
+    def __init__(
+        self, fp, start: int, size: int, fat, sector_size: int, base: int,
+        buffer=None,
+    ):
+        super().__init__()
+        self._fp = fp
+        self._buffer = buffer
+        self._fat = fat
+        self._sector_size = sector_size
+        self._base = base
+        self._chain = [start] if size else []
+        self._pos = 0
+        self.size = size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def _sector(self, index: int):
+        """Sector number of the index-th sector, extending the chain as needed."""
+        chain = self._chain
+        while len(chain) <= index:
+            nxt = self._fat[chain[-1]]
+            if nxt > olefile.MAXREGSECT or nxt >= len(self._fat):
+                raise OSError(
+                    f"Sector chain ends after {len(chain)} sectors, "
+                    f"stream claims {self.size} bytes"
+                )
+            chain.append(nxt)
+        return chain[index]
+
+    def _run_length(self, index: int, last_index: int):
+        """Number of physically adjacent sectors from index, up to last_index."""
+        first = self._sector(index)
+        run = 1
+        while index + run <= last_index and self._sector(index + run) == first + run:
+            run += 1
+        return run
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast("B")
+        end = min(self.size, self._pos + len(view))
+        filled = 0
+        ss = self._sector_size
+        while self._pos < end:
+            index, within = divmod(self._pos, ss)
+            run = self._run_length(index, (end - 1) // ss)
+            want = min(end - self._pos, run * ss - within)
+            at = self._base + self._sector(index) * ss + within
+            if self._buffer is not None:
+                got = max(0, min(want, len(self._buffer) - at))
+                view[filled : filled + got] = self._buffer[at : at + got]
+            else:
+                self._fp.seek(at)
+                got = self._fp.readinto(view[filled : filled + want])
+            if not got:
+                break
+            filled += got
+            self._pos += got
+            if got < want:
+                break
+        return filled
+
+    def read(self, size: int = -1):
+        if size is None or size < 0:
+            size = max(0, self.size - self._pos)
+        return super().read(size)
+
+    def readall(self):
+        return self.read(-1)
+
+    def view(self, offset: int = 0, length: int | None = None):
+        """
+        memoryview of stream[offset:offset + length]. On a mapped stream a
+        range inside one run of adjacent sectors is a zero-copy slice of
+        the mapping; a fragmented range (or an unmapped stream) is
+        assembled into new bytes. The read position is not changed.
+        """
+        end = self.size if length is None else min(self.size, offset + length)
+        if offset >= end:
+            return memoryview(b"")
+        ss = self._sector_size
+        index, within = divmod(offset, ss)
+        last_index = (end - 1) // ss
+        if self._buffer is not None and (
+            self._run_length(index, last_index) == last_index - index + 1
+        ):
+            at = self._base + self._sector(index) * ss + within
+            if at + end - offset <= len(self._buffer):
+                return self._buffer[at : at + end - offset]
+        pos = self._pos
+        try:
+            self.seek(offset)
+            return memoryview(self.read(end - offset))
+        finally:
+            self._pos = pos
+
+    def iter_chunks(self, chunk_size: int = READ_CHUNK_SIZE):
+        """Yield the rest of the stream in chunks (for chunked scanners)."""
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _mini_stream(ole):
+    """
+    (reader, view) for the mini stream (root entry) of ole, created once.
+    view is None unless ole was opened with mapped_olefile().
+    """
+    mini = getattr(ole, "_lazy_ministream", None)
+    if mini is None:
+        if ole.minifat is None:
+            ole.loadminifat()
+        root = ole.root
+        buffer = getattr(ole, "_lazy_buffer", None)
+        reader = LazyOleStream(
+            ole.fp, root.isectStart, root.size, ole.fat, ole.sectorsize,
+            ole.sectorsize, buffer,
+        )
+        mini = ole._lazy_ministream = (
+            reader, reader.view() if buffer is not None else None
+        )
+    return mini
+
+
+def open_lazy_stream(ole, name):
+    """
+    LazyOleStream for a stream of an open olefile.OleFileIO.
+    name is a path string ("Global/Latest") or a list as returned by
+    listdir(). Streams below the mini stream cutoff live in the mini
+    stream and are addressed through the MiniFAT.
+    """
+    sid = ole._find(name)
+    entry = ole.direntries[sid]
+    if entry.entry_type != olefile.STGTY_STREAM:
+        raise OSError(f"Not a stream: {name}")
+    if entry.size < ole.minisectorcutoff:
+        mini, mini_view = _mini_stream(ole)
+        return LazyOleStream(
+            mini, entry.isectStart, entry.size, ole.minifat,
+            ole.minisectorsize, 0, mini_view,
+        )
+    return LazyOleStream(
+        ole.fp, entry.isectStart, entry.size, ole.fat, ole.sectorsize,
+        ole.sectorsize, getattr(ole, "_lazy_buffer", None),
+    )
+
+
+@contextlib.contextmanager
+def mapped_olefile(path):
+    """
+    Open a compound file read-only through mmap and yield its OleFileIO.
+
+    olefile parses the header, FAT and directory from the mapping as
+    usual; streams opened with open_lazy_stream() then read from the
+    mapping, and their view() returns slices of it without copying.
+    Views still referenced after the block keep the mapping alive until
+    they are released.
+    """
+    with open(path, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        with olefile.OleFileIO(mm) as ole:
+            ole._lazy_buffer = memoryview(mm)
+            try:
+                yield ole
+            finally:
+                ole._lazy_ministream = None
+                ole._lazy_buffer.release()
+    finally:
+        try:
+            mm.close()
+        except BufferError:
+            pass  # views handed out are still alive
@@ -0,0 +1,134 @@
+import atexit
+import contextlib
+import os
+import sys
+import time
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+# After setup_console(), safe_print collects lines and writes them in
+# batches; a batch goes out when it is full, when FLUSH_INTERVAL seconds
+# passed since the last write (so progress output still shows up), before
+# a traceback is printed and at exit.
+CONSOLE_BATCH_LINES = 4096
+FLUSH_INTERVAL = 0.2
+
+_console = None
+_pending = []
+_last_flush = 0.0
+_default_excepthook = sys.excepthook
+
+
+def setup_console():
+    """
+    Set sys.stdout up for bulk output, for the rest of the process: characters
+    the console encoding cannot represent are written as backslash escapes
+    instead of raising, output is block-buffered instead of flushed after
+    every line on a terminal, and safe_print batches its lines. Scripts
+    call this once at the start of main(). Returns the stream.
+    """
+    global _console
+    stream = sys.stdout
+    if stream is not _console:
+        flush_console()
+        reconfigure = getattr(stream, "reconfigure", None)
+        if reconfigure is not None:
+            reconfigure(errors="backslashreplace", line_buffering=False)
+        _console = stream
+        sys.excepthook = _flush_excepthook
+    return stream
+
+
+def flush_console():
+    """Write out the lines batched by safe_print."""
+    global _last_flush
+    _last_flush = time.monotonic()
+    if _console is None:
+        return
+    if _pending:
+        _pending.append("")
+        text = "\n".join(_pending)
+        _pending.clear()
+        _console.write(text)
+    _console.flush()
+
+
+def _flush_excepthook(exc_type, exc, tb):
+    # queued stdout lines belong before the traceback on stderr
+    try:
+        flush_console()
+    except Exception:
+        pass
+    _default_excepthook(exc_type, exc, tb)
+
+
+def _flush_at_exit():
+    try:
+        flush_console()
+    except BrokenPipeError:
+        # reader went away (e.g. | head); silence the final flush too
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
+
+atexit.register(_flush_at_exit)
+
+
+def _write_line(text: str):
+    stream = sys.stdout
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    stream.write(
+        text.encode(encoding, "backslashreplace").decode(encoding) + "\n"
+    )
+
+
+def safe_print(text: str = ""):
+    """
+    Queue one line for the console; never raises UnicodeEncodeError.
+    Without setup_console() (or once sys.stdout was replaced) the line is
+    written straight away instead.
+    """
+    if _console is None or sys.stdout is not _console:
+        _write_line(text)
+        return
+    _pending.append(text)
+    if (
+        len(_pending) >= CONSOLE_BATCH_LINES
+        or time.monotonic() - _last_flush > FLUSH_INTERVAL
+    ):
+        flush_console()
+
+
+@contextlib.contextmanager
+def report_writer(path, echo=None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+    """
+    Stream a text report to path instead of collecting it in a list.
+
+    Yields emit(text=""): each call writes one line through a buffered
+    file handle (lines joined with "\\n", no trailing newline, same as
+    "\\n".join(lines)). If echo is given (e.g. safe_print) every line is
+    passed to it as well. Memory use does not grow with the report size.
+    """
+    fh = open(path, "w", encoding="utf-8", newline="\n", buffering=buffer_size)
+    first = True
+
+    def emit(text: str = ""):
+        nonlocal first
+        if echo is not None:
+            echo(text)
+        if first:
+            first = False
+        else:
+            fh.write("\n")
+        fh.write(text)
+
+    try:
+        yield emit
+    finally:
+        fh.close()
+
+
+def emit_lines(lines, emit):
+    """Emit every line of an iterable (list or generator)."""
+    for line in lines:
+        emit(line)
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+STATE_VERSION = 1
+
+
+def load_state(state_path: Path):
+    """Load the incremental-run state; a missing or unreadable file means empty."""
+    try:
+        state = json.loads(Path(state_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("files", {})
+
+
+def save_state(state_path: Path, files: dict):
+    state_path = Path(state_path)
+    tmp = state_path.with_name(state_path.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"version": STATE_VERSION, "files": files}, indent=1),
+        encoding="utf-8",
+    )
+    os.replace(tmp, state_path)
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def state_key(path: Path) -> str:
+    return str(Path(path).resolve())
+
+
+def is_unchanged(path: Path, entry: dict | None, mode: str, use_hash: bool = False):
+    """
+    Decide whether path can be skipped.
+
+    Unchanged means: same output mode, output still on disk and the same
+    size + mtime. With use_hash, a file whose mtime moved but whose sha256
+    still matches (a touch or a copy) also counts as unchanged, and the
+    entry's mtime is refreshed in place.
+    """
+    if not entry or entry.get("mode") != mode:
+        return False
+    report_dir = entry.get("report_dir")
+    if report_dir and not Path(report_dir).exists():
+        return False
+
+    st = Path(path).stat()
+    if st.st_size != entry.get("size"):
+        return False
+    if st.st_mtime_ns == entry.get("mtime_ns"):
+        return True
+    if use_hash and entry.get("sha256") and file_sha256(path) == entry["sha256"]:
+        # remember the new mtime so the next run skips the hash again
+        entry["mtime_ns"] = st.st_mtime_ns
+        return True
+    return False
+
+
+def file_identity(path: Path, use_hash: bool = False):
+    """
+    Size, mtime (and with use_hash the sha256) of path. Taken by the worker
+    before it reads the file, so a change made while the file is being
+    processed makes the next run see it as changed.
+    """
+    st = Path(path).stat()
+    identity = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if use_hash:
+        identity["sha256"] = file_sha256(path)
+    return identity
+
+
+def make_entry(result: dict, mode: str):
+    """
+    Build the state entry for a successfully processed file from its
+    result, which carries the file_identity taken before processing.
+    """
+    return {
+        **result["identity"],
+        "mode": mode,
+        "report_dir": result.get("report_dir"),
+        "streams": result.get("streams"),
+        "bytes": result.get("bytes"),
+    }
@@ -0,0 +1,53 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.json"
+
+
+def blob_path(store_dir: Path, digest: str) -> Path:
+    """Blobs are fanned out by the first two hex digits, like git objects."""
+    return Path(store_dir) / "objects" / digest[:2] / digest[2:]
+
+
+def store_blob(store_dir: Path, data: bytes):
+    """
+    Write data to the store under its sha256 unless it is already there.
+    Returns (digest, written) where written is False for a deduplicated blob.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    target = blob_path(store_dir, digest)
+    if target.exists():
+        return digest, False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # write to a private temp name first, so parallel workers storing the
+    # same blob never expose a half-written file
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+    return digest, True
+
+
+def load_blob(store_dir: Path, digest: str) -> bytes:
+    return blob_path(store_dir, digest).read_bytes()
+
+
+def write_manifest(report_dir: Path, source: Path, streams: dict):
+    """
+    Write <report_dir>/manifest.json mapping stream names to
+    {"sha256": ..., "size": ...}.
+    """
+    manifest = {
+        "source": str(source),
+        "streams": streams,
+    }
+    path = Path(report_dir) / MANIFEST_NAME
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return path
+
+
+def read_manifest(report_dir: Path):
+    path = Path(report_dir) / MANIFEST_NAME
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,138 @@
+import numpy as np
+
+DEFAULT_MAX_STRIDE = 256
+DEFAULT_MAX_HEADER = 64
+# strides are scored on at most this many bytes, so a whole batch of
+# streams can be analysed; 256 KiB holds >= 1000 records of any stride
+ANALYSIS_WINDOW = 256 << 10
+# strides need at least this many records in the buffer to be ranked
+MIN_RECORDS = 4
+# a stride is dropped when one of its divisors scores at least this share
+# of its score (multiples of the real record size score about the same)
+HARMONIC_SHARE = 0.95
+
+
+def byte_autocorrelation(data, max_stride: int = DEFAULT_MAX_STRIDE):
+    """
+    match[s] = share of bytes equal to the byte s positions later, for
+    s = 1..max_stride (match[0] is unused). One vectorized compare per
+    stride over the analysis window.
+    """
+    view = np.frombuffer(data, dtype=np.uint8)[:ANALYSIS_WINDOW]
+    match = np.zeros(max_stride + 1)
+    for s in range(1, min(max_stride, view.size - 1) + 1):
+        match[s] = np.count_nonzero(view[s:] == view[:-s]) / (view.size - s)
+    return match
+
+
+def byte_entropy(view):
+    """Shannon entropy (bits per byte) of a uint8 array."""
+    if not view.size:
+        return 0.0
+    p = np.bincount(view, minlength=256) / view.size
+    p = p[p > 0]
+    return float(-(p * np.log2(p)).sum())
+
+
+def column_entropy(data, stride: int, header: int = 0):
+    """
+    Mean entropy of the byte columns when data[header:] is cut into
+    records of stride bytes. Fixed fields give low-entropy columns, so a
+    real record layout scores well below the entropy of the whole buffer.
+    """
+    view = np.frombuffer(data, dtype=np.uint8)[header : header + ANALYSIS_WINDOW]
+    rows = view.size // stride
+    if rows < 2:
+        return None
+    table = view[: rows * stride].reshape(rows, stride)
+    # one bincount over (column, byte) pairs instead of one per column
+    keys = (np.arange(stride, dtype=np.int64) * 256 + table).ravel()
+    counts = np.bincount(keys, minlength=stride * 256).reshape(stride, 256)
+    p = counts / rows
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bits = -np.where(p > 0, p * np.log2(p), 0.0).sum(axis=1)
+    return float(bits.mean())
+
+
+def find_count_fields(data, stride: int, max_header: int = DEFAULT_MAX_HEADER):
+    """
+    u16/u32 values in the first max_header bytes that could be a record
+    count for this stride: count * stride fits behind the field and covers
+    most of the rest of the buffer. Returns dicts (field offset, width,
+    count, header size, coverage), best coverage first.
+    """
+    found = []
+    size = len(data)
+    for width, code in ((4, "<u4"), (2, "<u2")):
+        for offset in range(0, min(max_header, size - width + 1)):
+            count = int(np.frombuffer(data, dtype=code, count=1, offset=offset)[0])
+            header = offset + width
+            if count < 2 or header + count * stride > size:
+                continue
+            coverage = count * stride / (size - header)
+            if coverage >= 0.5:
+                found.append({
+                    "field_offset": offset,
+                    "field_width": width,
+                    "count": count,
+                    "header": header,
+                    "coverage": coverage,
+                })
+    found.sort(key=lambda f: (-f["coverage"], f["header"]))
+    return found
+
+
+def rank_strides(
+    data,
+    max_stride: int = DEFAULT_MAX_STRIDE,
+    max_header: int = DEFAULT_MAX_HEADER,
+    top: int = 5,
+):
+    """
+    Rank likely fixed record sizes of a decompressed buffer.
+
+    Strides 2..max_stride with at least MIN_RECORDS records are scored.
+    The score of a stride is its byte autocorrelation above the level
+    expected from the byte frequencies alone (sum of p^2). Multiples of a
+    better-scoring divisor are dropped. Each candidate comes with its
+    column entropy (vs. the buffer entropy) and, where one is found, a
+    count field giving the header size.
+
+    Returns [{"stride", "score", "match", "column_entropy",
+    "count_field"}], best first, plus the buffer entropy:
+    (candidates, entropy).
+    """
+    view = np.frombuffer(data, dtype=np.uint8)[:ANALYSIS_WINDOW]
+    if view.size < 16:
+        return [], byte_entropy(view)
+    p = np.bincount(view, minlength=256) / view.size
+    baseline = float((p * p).sum())
+    max_stride = min(max_stride, view.size // MIN_RECORDS)
+    match = byte_autocorrelation(data, max_stride)
+    score = match - baseline
+
+    # stride 1 only measures runs of equal bytes, not records
+    order = [int(s) for s in np.argsort(-score[2:], kind="stable") + 2]
+    kept = []
+    for s in order:
+        if score[s] <= 0 or len(kept) >= top:
+            break
+        if any(
+            s % d == 0 and score[d] >= HARMONIC_SHARE * score[s]
+            for d in range(2, s)
+        ):
+            continue
+        kept.append(s)
+
+    candidates = []
+    for s in kept:
+        counts = find_count_fields(data, s, max_header)
+        header = counts[0]["header"] if counts else 0
+        candidates.append({
+            "stride": s,
+            "score": float(score[s]),
+            "match": float(match[s]),
+            "column_entropy": column_entropy(data, s, header),
+            "count_field": counts[0] if counts else None,
+        })
+    return candidates, byte_entropy(view)
@@ -0,0 +1,136 @@
+import re
+
+try:
+    import numpy as np
+except ImportError:  # the regex path below is used instead
+    np = None
+
+_UTF16LE_PATTERNS = {}
+_ASCII_PATTERNS = {}
+ASCII_RUN = re.compile(rb"[\x20-\x7e]+")
+
+
+def _ascii_pattern(min_len: int):
+    pat = _ASCII_PATTERNS.get(min_len)
+    if pat is None:
+        pat = re.compile(rb"[\x20-\x7e]{%d,}" % max(1, min_len))
+        _ASCII_PATTERNS[min_len] = pat
+    return pat
+
+
+def iter_ascii_strings(blob, min_len: int = 4, limit: int | None = None):
+    """
+    Lazily yield (offset, string) for printable ASCII runs of at least
+    min_len bytes. One compiled regex scan over a memoryview; no per-byte
+    Python work and no copy of blob. Stops after limit hits.
+    """
+    if not isinstance(blob, bytes):
+        blob = memoryview(blob)
+    for count, m in enumerate(_ascii_pattern(min_len).finditer(blob)):
+        if limit is not None and count >= limit:
+            return
+        yield m.start(), m.group().decode("ascii")
+
+
+def ascii_strings(blob, min_len: int = 4, limit: int | None = None):
+    """Search for normal ASCII strings in raw bytes."""
+    return [s for _, s in iter_ascii_strings(blob, min_len, limit)]
+
+
+def iter_ascii_strings_chunked(chunks, min_len: int = 6, max_len: int = 4096):
+    """
+    Find ASCII strings across a sequence of byte chunks.
+    A run that touches the end of a chunk is carried into the next one
+    (at most max_len bytes), so strings split by chunk boundaries survive.
+    Yields (offset, string) with offsets into the concatenated data.
+    """
+    carry = b""
+    carry_off = 0
+    pos = 0
+    for chunk in chunks:
+        data = carry + chunk
+        base = carry_off if carry else pos
+        pos += len(chunk)
+        carry = b""
+        for m in ASCII_RUN.finditer(data):
+            if m.end() == len(data) and len(data) - m.start() < max_len:
+                carry = data[m.start() :]
+                carry_off = base + m.start()
+                break
+            if m.end() - m.start() >= min_len:
+                yield base + m.start(), m.group().decode("ascii")
+    if len(carry) >= min_len:
+        yield carry_off, carry.decode("ascii")
+
+
+def _utf16le_pattern(min_len: int):
+    pat = _UTF16LE_PATTERNS.get(min_len)
+    if pat is None:
+        pat = re.compile(rb"(?:[\x20-\x7e]\x00){%d,}" % max(1, min_len))
+        _UTF16LE_PATTERNS[min_len] = pat
+    return pat
+
+
+def _utf16le_runs_numpy(blob, min_len: int, alignments):
+    """Run boundaries from a vectorized 'printable byte + 00' mask."""
+    arr = np.frombuffer(blob, dtype=np.uint8)
+    if len(arr) < 2:
+        return
+    # uint8 wrap-around turns the 0x20..0x7E range check into one compare
+    pair_ok = ((arr[:-1] - 0x20) < 0x5F) & (arr[1:] == 0)
+    for alignment in alignments:
+        mask = pair_ok[alignment::2].view(np.int8)
+        edges = np.diff(mask, prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = (ends - starts) >= min_len
+        for s, e in zip(starts[keep].tolist(), ends[keep].tolist()):
+            yield alignment + 2 * s, alignment + 2 * e
+
+
+def _utf16le_runs_regex(blob, min_len: int, alignments):
+    # A printable byte can't also be the 00 half of a neighbouring pair, so
+    # runs at offset 0 and 1 never overlap and one regex pass finds them all.
+    spans = [m.span() for m in _utf16le_pattern(min_len).finditer(blob)]
+    for alignment in alignments:
+        for start, end in spans:
+            if start % 2 == alignment:
+                yield start, end
+
+
+def iter_utf16le_strings(blob, min_len: int = 4, alignment: int | None = None):
+    """
+    Yield (offset, string) for every run of printable ASCII UTF-16LE code
+    units (XX 00 pairs) of at least min_len characters.
+
+    Both alignments are scanned in one pass over the buffer; results come
+    alignment 0 first, then alignment 1, each in offset order. Pass
+    alignment=0 or 1 to keep only one of them.
+    """
+    alignments = (0, 1) if alignment is None else (alignment,)
+    min_len = max(1, min_len)
+    runs = _utf16le_runs_numpy if np is not None else _utf16le_runs_regex
+    if not isinstance(blob, bytes):
+        blob = memoryview(blob)
+    for start, end in runs(blob, min_len, alignments):
+        yield start, str(blob[start:end], "utf-16-le")
+
+
+def utf16le_strings_all_alignments(blob, min_len: int = 4, with_offsets: bool = False):
+    """
+    Search for UTF-16LE strings at both possible alignments (offset 0 and 1).
+    Returns unique strings in first-seen order; with_offsets=True returns
+    (offset, string) pairs instead.
+    """
+    seen = set()
+    results = []
+    for off, s in iter_utf16le_strings(blob, min_len):
+        if s not in seen:
+            seen.add(s)
+            results.append((off, s) if with_offsets else s)
+    return results
+
+
+def utf16le_strings(blob, min_len: int = 4):
+    """UTF-16LE strings at alignment 0 only, duplicates kept."""
+    return [s for _, s in iter_utf16le_strings(blob, min_len, alignment=0)]